@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -16,10 +17,13 @@ import yaml
 
 from apcore.context import Context
 from apcore.errors import ACLRuleError, ConfigNotFoundError
-from apcore.utils.pattern import match_pattern
+from apcore.utils.pattern import compile_pattern
 
 __all__ = ["ACLRule", "ACL"]
 
+# Safe loader, C-accelerated when PyYAML has libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ACLRule:
@@ -36,6 +40,28 @@ class ACLRule:
     conditions: dict[str, Any] | None = None
 
 
+class _CompiledRule:
+    """An ACLRule with its patterns turned into predicates once, when the rule is added.
+
+    ``@system`` depends on the context rather than the ID, so it is kept as a
+    flag next to the predicates. ``@external`` needs no special case, because
+    the caller of an external call is the literal ``"@external"``.
+    """
+
+    __slots__ = ("caller_system", "callers", "rule", "target_system", "targets")
+
+    def __init__(self, rule: ACLRule) -> None:
+        self.rule = rule
+        self.callers = _compile_patterns(rule.callers)
+        self.targets = _compile_patterns(rule.targets)
+        self.caller_system = "@system" in rule.callers
+        self.target_system = "@system" in rule.targets
+
+
+def _compile_patterns(patterns: list[str]) -> tuple[Callable[[str], bool], ...]:
+    return tuple(compile_pattern(p) for p in patterns if p != "@system")
+
+
 class ACL:
     """Access Control List with pattern-based rules and first-match-wins evaluation.
 
@@ -44,6 +70,9 @@ class ACL:
     Thread safety:
         Internally synchronized. All public methods (check, add_rule,
         remove_rule, reload) are safe to call concurrently.
+
+    Rule patterns are compiled when a rule is added, so changing the
+    ``callers`` or ``targets`` of a rule already in the ACL has no effect.
     """
 
     def __init__(self, rules: list[ACLRule], default_effect: str = "deny") -> None:
@@ -54,6 +83,8 @@ class ACL:
             default_effect: Effect when no rule matches ('allow' or 'deny').
         """
         self._rules: list[ACLRule] = list(rules)
+        # Replaced, never mutated, so check() can read it without copying
+        self._compiled: tuple[_CompiledRule, ...] = tuple(_CompiledRule(r) for r in self._rules)
         self._default_effect: str = default_effect
         self._yaml_path: str | None = None
         self.debug: bool = False
@@ -79,7 +110,7 @@ class ACL:
 
         with open(yaml_path, encoding="utf-8") as f:
             try:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
             except yaml.YAMLError as e:
                 raise ACLRuleError(f"Invalid YAML in {yaml_path}: {e}") from e
 
@@ -149,11 +180,13 @@ class ACL:
         effective_caller = "@external" if caller_id is None else caller_id
 
         with self._lock:
-            rules = list(self._rules)
+            compiled = self._compiled
             default_effect = self._default_effect
 
-        for rule in rules:
-            if self._matches_rule(rule, effective_caller, target_id, context):
+        is_system = context is not None and context.identity is not None and context.identity.type == "system"
+        for entry in compiled:
+            if self._matches_rule(entry, effective_caller, target_id, context, is_system):
+                rule = entry.rule
                 decision = rule.effect == "allow"
                 self._logger.debug(
                     "ACL check: caller=%s target=%s decision=%s rule=%s",
@@ -173,24 +206,13 @@ class ACL:
         )
         return default_decision
 
-    def _match_pattern(self, pattern: str, value: str, context: Context | None = None) -> bool:
-        """Match a single pattern against a value, with special pattern handling.
-
-        Handles @external and @system patterns locally, delegates all
-        other patterns to the foundation match_pattern() utility.
-        """
-        if pattern == "@external":
-            return value == "@external"
-        if pattern == "@system":
-            return context is not None and context.identity is not None and context.identity.type == "system"
-        return match_pattern(pattern, value)
-
     def _matches_rule(
         self,
-        rule: ACLRule,
+        entry: _CompiledRule,
         caller: str,
         target: str,
         context: Context | None,
+        is_system: bool,
     ) -> bool:
         """Check if a single rule matches the caller and target.
 
@@ -198,17 +220,21 @@ class ACL:
         1. At least one caller pattern matches the caller (OR logic).
         2. At least one target pattern matches the target (OR logic).
         3. If conditions are present, they must all be satisfied.
+
+        ``@system`` matches when ``is_system`` is set, i.e. the context
+        identity has type "system".
         """
-        caller_match = any(self._match_pattern(p, caller, context) for p in rule.callers)
+        caller_match = (entry.caller_system and is_system) or any(match(caller) for match in entry.callers)
         if not caller_match:
             return False
 
-        target_match = any(self._match_pattern(p, target, context) for p in rule.targets)
+        target_match = (entry.target_system and is_system) or any(match(target) for match in entry.targets)
         if not target_match:
             return False
 
-        if rule.conditions is not None:
-            if not self._check_conditions(rule.conditions, context):
+        conditions = entry.rule.conditions
+        if conditions is not None:
+            if not self._check_conditions(conditions, context):
                 return False
 
         return True
@@ -243,8 +269,10 @@ class ACL:
         Args:
             rule: The ACLRule to add.
         """
+        entry = _CompiledRule(rule)
         with self._lock:
             self._rules.insert(0, rule)
+            self._compiled = (entry, *self._compiled)
 
     def remove_rule(self, callers: list[str], targets: list[str]) -> bool:
         """Remove the first rule matching the given callers and targets.
@@ -260,6 +288,7 @@ class ACL:
             for i, rule in enumerate(self._rules):
                 if rule.callers == callers and rule.targets == targets:
                     self._rules.pop(i)
+                    self._compiled = self._compiled[:i] + self._compiled[i + 1 :]
                     return True
             return False
 
@@ -276,4 +305,5 @@ class ACL:
         reloaded = ACL.load(yaml_path)
         with self._lock:
             self._rules = reloaded._rules
+            self._compiled = reloaded._compiled
             self._default_effect = reloaded._default_effect
@@ -28,6 +28,9 @@ from apcore.registry import Registry
 
 __all__ = ["BindingLoader"]
 
+# CSafeLoader if available, otherwise the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _JSON_SCHEMA_TYPE_MAP: dict[str, type] = {
     "string": str,
     "integer": int,
@@ -78,7 +81,7 @@ class BindingLoader:
             raise BindingFileInvalidError(file_path=file_path, reason=str(exc)) from exc
 
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YAML_LOADER)
         except yaml.YAMLError as exc:
             raise BindingFileInvalidError(file_path=file_path, reason=f"YAML parse error: {exc}") from exc
 
@@ -191,7 +194,7 @@ class BindingLoader:
                     reason="Schema reference file not found",
                 )
             try:
-                ref_data = yaml.safe_load(ref_path.read_text())
+                ref_data = yaml.load(ref_path.read_text(), Loader=_YAML_LOADER)
             except yaml.YAMLError as exc:
                 raise BindingFileInvalidError(
                     file_path=str(ref_path),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import bisect
+import sys
 import threading
 import time
 from typing import Any
@@ -9,6 +11,18 @@ from typing import Any
 from apcore.errors import ModuleError
 from apcore.middleware import Middleware
 
+# Label values up to this length are interned; longer ones are rarely repeated.
+_INTERN_MAX_LEN = 32
+
+
+def _intern(value: str) -> str:
+    """Intern a short exact ``str``; longer strings and str subclasses pass through."""
+    # sys.intern rejects str subclasses such as StrEnum members
+    if type(value) is str and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
 _DESCRIPTIONS = {
     "apcore_module_calls_total": "Total module calls",
     "apcore_module_errors_total": "Total module errors",
@@ -16,8 +30,55 @@ _DESCRIPTIONS = {
 }
 
 
+class _HistogramCell:
+    """Sum, count and per-bucket counts of one histogram series.
+
+    ``buckets[i]`` counts observations that fall into bucket ``i`` only (not
+    cumulative); the final slot holds observations above the largest bound.
+    """
+
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.sum = 0.0
+        self.count = 0
+        self.buckets = [0] * (bucket_count + 1)
+
+    def cumulative_buckets(self) -> list[int]:
+        """Return Prometheus-style cumulative counts for each finite bucket bound."""
+        totals: list[int] = []
+        running = 0
+        for count in self.buckets[:-1]:
+            running += count
+            totals.append(running)
+        return totals
+
+
+_SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class _ThreadCounters:
+    """Counter increments recorded by one thread without taking the collector lock.
+
+    Only the owning thread writes ``counts``; readers merge a copy of it under
+    the collector lock when a snapshot or export is taken.
+    """
+
+    __slots__ = ("counts", "generation", "thread")
+
+    def __init__(self, generation: int) -> None:
+        self.counts: dict[_SeriesKey, int] = {}
+        self.generation = generation
+        self.thread = threading.current_thread()
+
+
 class MetricsCollector:
-    """Thread-safe in-memory metrics store for counters and histograms."""
+    """Thread-safe in-memory metrics store for counters and histograms.
+
+    Counters are accumulated per thread (LongAdder-style) so ``increment``
+    only takes the lock the first time a thread sees a series; per-thread
+    counts are summed on ``snapshot`` and ``export_prometheus``.
+    """
 
     DEFAULT_BUCKETS: list[float] = [
         0.005,
@@ -38,116 +99,180 @@ class MetricsCollector:
     def __init__(self, buckets: list[float] | None = None) -> None:
         self._buckets = sorted(buckets) if buckets is not None else list(self.DEFAULT_BUCKETS)
         self._lock = threading.Lock()
-        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
-        self._histogram_sums: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
-        self._histogram_counts: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
-        self._histogram_buckets: dict[tuple[str, tuple[tuple[str, str], ...], float], int] = {}
+        # Every known counter series, holding the totals folded in from finished threads
+        self._counters: dict[_SeriesKey, int] = {}
+        self._histograms: dict[_SeriesKey, _HistogramCell] = {}
+        self._local = threading.local()
+        self._thread_counters: list[_ThreadCounters] = []
+        # Bumped by reset() so threads drop their old per-thread counts
+        self._generation = 0
+        # Label keys of each metric in first-seen order, so export needs no global sort
+        self._counter_series: dict[str, list[tuple[tuple[str, str], ...]]] = {}
+        self._histogram_series: dict[str, list[tuple[tuple[str, str], ...]]] = {}
 
     @staticmethod
     def _labels_key(labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
-        return tuple(sorted(labels.items()))
+        """Build a hashable labels key, interning short strings so repeated keys share objects."""
+        return tuple(sorted((_intern(k), _intern(v)) for k, v in labels.items()))
 
     def increment(self, name: str, labels: dict[str, str], amount: int = 1) -> None:
-        key = (name, self._labels_key(labels))
+        name = _intern(name)
+        labels_key = self._labels_key(labels)
+        key = (name, labels_key)
+        local: _ThreadCounters | None = getattr(self._local, "counters", None)
+        if local is None or local.generation != self._generation:
+            local = self._register_thread_counters()
+        counts = local.counts
+        if key in counts:
+            counts[key] += amount
+            return
         with self._lock:
-            self._counters[key] = self._counters.get(key, 0) + amount
+            if key not in self._counters:
+                self._counters[key] = 0
+                self._counter_series.setdefault(name, []).append(labels_key)
+        counts[key] = amount
+
+    def _register_thread_counters(self) -> _ThreadCounters:
+        """Create and register the calling thread's counter store for the current generation.
+
+        Stores of threads that have exited are folded in first, so a pool that
+        keeps replacing worker threads does not grow the registry.
+        """
+        with self._lock:
+            self._fold_finished_threads()
+            local = _ThreadCounters(self._generation)
+            self._thread_counters.append(local)
+        self._local.counters = local
+        return local
+
+    def _fold_finished_threads(self) -> None:
+        """Move the counts of exited threads into ``self._counters`` and drop their stores.
+
+        Must be called with ``self._lock`` held.
+        """
+        alive: list[_ThreadCounters] = []
+        for local in self._thread_counters:
+            if local.thread.is_alive():
+                alive.append(local)
+                continue
+            for key, value in local.counts.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+        self._thread_counters = alive
+
+    def _merged_counters(self) -> dict[_SeriesKey, int]:
+        """Sum per-thread counts into totals, folding in threads that have exited.
+
+        Must be called with ``self._lock`` held.
+        """
+        self._fold_finished_threads()
+        merged = dict(self._counters)
+        for local in self._thread_counters:
+            for key, value in local.counts.copy().items():
+                merged[key] = merged.get(key, 0) + value
+        return merged
 
     def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        name = _intern(name)
         labels_key = self._labels_key(labels)
         key = (name, labels_key)
+        bucket_index = bisect.bisect_left(self._buckets, value)
         with self._lock:
-            self._histogram_sums[key] = self._histogram_sums.get(key, 0.0) + value
-            self._histogram_counts[key] = self._histogram_counts.get(key, 0) + 1
-            for b in self._buckets:
-                if value <= b:
-                    bkey = (name, labels_key, b)
-                    self._histogram_buckets[bkey] = self._histogram_buckets.get(bkey, 0) + 1
-            # Always increment +Inf
-            inf_key = (name, labels_key, float("inf"))
-            self._histogram_buckets[inf_key] = self._histogram_buckets.get(inf_key, 0) + 1
+            cell = self._histograms.get(key)
+            if cell is None:
+                cell = self._histograms[key] = _HistogramCell(len(self._buckets))
+                self._histogram_series.setdefault(name, []).append(labels_key)
+            cell.sum += value
+            cell.count += 1
+            cell.buckets[bucket_index] += 1
 
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
+            sums: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+            counts: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
+            buckets: dict[tuple[str, tuple[tuple[str, str], ...], float], int] = {}
+            for (name, labels_key), cell in self._histograms.items():
+                sums[(name, labels_key)] = cell.sum
+                counts[(name, labels_key)] = cell.count
+                for bound, count in zip(self._buckets, cell.cumulative_buckets()):
+                    if count:
+                        buckets[(name, labels_key, bound)] = count
+                buckets[(name, labels_key, float("inf"))] = cell.count
             return {
-                "counters": dict(self._counters),
-                "histograms": {
-                    "sums": dict(self._histogram_sums),
-                    "counts": dict(self._histogram_counts),
-                    "buckets": dict(self._histogram_buckets),
-                },
+                "counters": self._merged_counters(),
+                "histograms": {"sums": sums, "counts": counts, "buckets": buckets},
             }
 
     def reset(self) -> None:
         with self._lock:
+            self._generation += 1
+            self._thread_counters.clear()
             self._counters.clear()
-            self._histogram_sums.clear()
-            self._histogram_counts.clear()
-            self._histogram_buckets.clear()
+            self._histograms.clear()
+            self._counter_series.clear()
+            self._histogram_series.clear()
 
     def export_prometheus(self) -> str:
         with self._lock:
+            counters = self._merged_counters()
             lines: list[str] = []
 
-            # Counters
-            counter_names: set[str] = set()
-            for (name, _labels_tuple), value in sorted(self._counters.items()):
-                if name not in counter_names:
-                    desc = _DESCRIPTIONS.get(name, name)
-                    lines.append(f"# HELP {name} {desc}")
-                    lines.append(f"# TYPE {name} counter")
-                    counter_names.add(name)
-                labels_str = self._format_labels(dict(_labels_tuple))
-                lines.append(f"{name}{labels_str} {value}")
-
-            # Histograms
-            hist_names: set[str] = set()
-            # Group by (name, labels_tuple)
-            hist_keys = sorted(self._histogram_sums.keys())
-            for name, labels_tuple in hist_keys:
-                if name not in hist_names:
-                    desc = _DESCRIPTIONS.get(name, name)
-                    lines.append(f"# HELP {name} {desc}")
-                    lines.append(f"# TYPE {name} histogram")
-                    hist_names.add(name)
-
-                labels_dict = dict(labels_tuple)
-                labels_str = self._format_labels(labels_dict)
-
-                # Bucket lines
-                for b in self._buckets:
-                    bkey = (name, labels_tuple, b)
-                    count = self._histogram_buckets.get(bkey, 0)
-                    le_str = f"{b:g}"
-                    le_labels = {**labels_dict, "le": f"{le_str}"}
-                    lines.append(f"{name}_bucket{self._format_labels(le_labels)} {count}")
-
-                # +Inf bucket
-                inf_key = (name, labels_tuple, float("inf"))
-                inf_count = self._histogram_buckets.get(inf_key, 0)
-                inf_labels = {**labels_dict, "le": "+Inf"}
-                lines.append(f"{name}_bucket{self._format_labels(inf_labels)} {inf_count}")
-
-                # _sum and _count
-                sum_val = self._histogram_sums.get((name, labels_tuple), 0.0)
-                count_val = self._histogram_counts.get((name, labels_tuple), 0)
-                lines.append(f"{name}_sum{labels_str} {sum_val}")
-                lines.append(f"{name}_count{labels_str} {count_val}")
+            # Counters, grouped by metric name in first-seen order
+            for name, series in self._counter_series.items():
+                desc = _DESCRIPTIONS.get(name, name)
+                lines.append(f"# HELP {name} {desc}")
+                lines.append(f"# TYPE {name} counter")
+                for labels_tuple in series:
+                    labels_str = self._format_labels(labels_tuple)
+                    lines.append(f"{name}{labels_str} {counters[(name, labels_tuple)]}")
+
+            # Histograms, grouped by metric name in first-seen order
+            for name, series in self._histogram_series.items():
+                desc = _DESCRIPTIONS.get(name, name)
+                lines.append(f"# HELP {name} {desc}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels_tuple in series:
+                    cell = self._histograms[(name, labels_tuple)]
+                    labels_str = self._format_labels(labels_tuple)
+                    # Bucket labels are the series labels followed by 'le'
+                    bucket_prefix = labels_str[1:-1] + "," if labels_str else ""
+
+                    # Bucket lines
+                    for b, count in zip(self._buckets, cell.cumulative_buckets()):
+                        lines.append(f'{name}_bucket{{{bucket_prefix}le="{b:g}"}} {count}')
+
+                    # +Inf bucket
+                    lines.append(f'{name}_bucket{{{bucket_prefix}le="+Inf"}} {cell.count}')
+
+                    # _sum and _count
+                    lines.append(f"{name}_sum{labels_str} {cell.sum}")
+                    lines.append(f"{name}_count{labels_str} {cell.count}")
 
             return "\n".join(lines) + "\n" if lines else ""
 
     @staticmethod
-    def _format_labels(labels: dict[str, str]) -> str:
+    def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+        """Format already-sorted label pairs as ``{k="v",...}``.
+
+        One and two labels (the apcore built-in metrics) are formatted with a
+        single f-string; larger label sets fall back to a join.
+        """
         if not labels:
             return ""
-        # Sort by key, but put 'le' last for histogram buckets
-        sorted_items = sorted(labels.items(), key=lambda x: (x[0] == "le", x[0]))
-        pairs = ",".join(f'{k}="{v}"' for k, v in sorted_items)
-        return "{" + pairs + "}"
+        if len(labels) == 1:
+            ((k1, v1),) = labels
+            return f'{{{k1}="{v1}"}}'
+        if len(labels) == 2:
+            (k1, v1), (k2, v2) = labels
+            return f'{{{k1}="{v1}",{k2}="{v2}"}}'
+        return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
 
     # --- Convenience methods ---
 
     def increment_calls(self, module_id: str, status: str) -> None:
-        self.increment("apcore_module_calls_total", {"module_id": module_id, "status": status})
+        self.increment(
+            "apcore_module_calls_total",
+            {"module_id": module_id, "status": status},
+        )
 
     def increment_errors(self, module_id: str, error_code: str) -> None:
         self.increment(
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import collections
-import dataclasses
 import json
 import logging
 import os
@@ -16,6 +15,56 @@ from typing import Any, Protocol, runtime_checkable
 
 from apcore.middleware import Middleware
 
+_SPAN_ID_BYTES = 8
+_SPAN_ID_POOL_SIZE = 4096
+
+_span_id_pool = threading.local()
+
+# Sampling compares a random 32-bit integer against rate * 2**32.
+_SAMPLING_BITS = 32
+
+# Per-thread Random instances, so sampling does not contend on the global one.
+_sampling_random = threading.local()
+
+
+def _thread_random() -> random.Random:
+    """Return the calling thread's ``random.Random`` instance, creating it on first use."""
+    rng: random.Random | None = getattr(_sampling_random, "rng", None)
+    if rng is None:
+        rng = _sampling_random.rng = random.Random()
+    return rng
+
+
+def _new_span_id() -> str:
+    """Return a random 16-character hex span ID.
+
+    Random bytes are drawn from a per-thread pool refilled with a single
+    ``os.urandom`` call, instead of one syscall per span.
+    """
+    buffer: bytes | None = getattr(_span_id_pool, "buffer", None)
+    offset: int = getattr(_span_id_pool, "offset", _SPAN_ID_POOL_SIZE)
+    if buffer is None or offset + _SPAN_ID_BYTES > len(buffer):
+        buffer = os.urandom(_SPAN_ID_POOL_SIZE)
+        _span_id_pool.buffer = buffer
+        offset = 0
+    _span_id_pool.offset = offset + _SPAN_ID_BYTES
+    return buffer[offset : offset + _SPAN_ID_BYTES].hex()
+
+
+def _reset_after_fork() -> None:
+    """Drop random state a forked child copied from its parent.
+
+    Otherwise the child would repeat the parent's span IDs and sampling
+    decisions; new per-thread state is created (and seeded) on first use.
+    """
+    global _span_id_pool, _sampling_random
+    _span_id_pool = threading.local()
+    _sampling_random = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 @dataclass
 class Span:
@@ -24,7 +73,7 @@ class Span:
     trace_id: str
     name: str
     start_time: float
-    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    span_id: str = field(default_factory=_new_span_id)
     parent_span_id: str | None = None
     attributes: dict[str, Any] = field(default_factory=dict)
     end_time: float | None = None
@@ -41,12 +90,27 @@ class SpanExporter(Protocol):
         ...
 
 
+def _span_to_dict(span: Span) -> dict[str, Any]:
+    """Build a JSON-ready dict of span fields without ``dataclasses.asdict`` deep copies."""
+    return {
+        "trace_id": span.trace_id,
+        "name": span.name,
+        "start_time": span.start_time,
+        "span_id": span.span_id,
+        "parent_span_id": span.parent_span_id,
+        "attributes": span.attributes,
+        "end_time": span.end_time,
+        "status": span.status,
+        "events": span.events,
+    }
+
+
 class StdoutExporter:
     """Exports spans as JSON lines to stdout."""
 
     def export(self, span: Span) -> None:
         """Write span as a single JSON line to stdout."""
-        data = dataclasses.asdict(span)
+        data = _span_to_dict(span)
         sys.stdout.write(json.dumps(data, default=str) + "\n")
 
 
@@ -176,6 +240,9 @@ class OTLPExporter:
 
 _VALID_STRATEGIES = {"full", "proportional", "error_first", "off"}
 
+# Stack placeholder for calls that will never be exported, so no Span is built.
+_UNSAMPLED = object()
+
 
 class TracingMiddleware(Middleware):
     """Middleware that creates and manages trace spans for module calls.
@@ -196,7 +263,9 @@ class TracingMiddleware(Middleware):
             raise ValueError(f"sampling_strategy must be one of {_VALID_STRATEGIES}, got {sampling_strategy!r}")
         self._exporter = exporter
         self._sampling_rate = sampling_rate
+        self._sampling_threshold = int(sampling_rate * (1 << _SAMPLING_BITS))
         self._sampling_strategy = sampling_strategy
+        self._disabled = sampling_strategy == "off"
 
     def _should_sample(self, context: Any) -> bool:
         """Make or inherit sampling decision."""
@@ -209,21 +278,32 @@ class TracingMiddleware(Middleware):
         elif self._sampling_strategy == "off":
             decision = False
         else:  # proportional or error_first
-            decision = random.random() < self._sampling_rate
+            decision = _thread_random().getrandbits(_SAMPLING_BITS) < self._sampling_threshold
 
         context.data["_tracing_sampled"] = decision
         return decision
 
     def before(self, module_id: str, inputs: dict[str, Any], context: Any) -> dict[str, Any] | None:
-        """Create a span, push to stack, make/inherit sampling decision."""
-        self._should_sample(context)
+        """Create a span, push to stack, make/inherit sampling decision.
+
+        Unsampled calls push a placeholder instead of a Span, unless the
+        ``error_first`` strategy may still need to export them on error.
+        """
+        if self._disabled:
+            return None
+        sampled = self._should_sample(context)
 
         spans_stack = context.data.setdefault("_tracing_spans", [])
-        parent_span_id = spans_stack[-1].span_id if spans_stack else None
+        if not sampled and self._sampling_strategy != "error_first":
+            spans_stack.append(_UNSAMPLED)
+            return None
+
+        parent = spans_stack[-1] if spans_stack else None
+        parent_span_id = parent.span_id if isinstance(parent, Span) else None
 
         span = Span(
             trace_id=context.trace_id,
-            span_id=os.urandom(8).hex(),
+            span_id=_new_span_id(),
             parent_span_id=parent_span_id,
             name="apcore.module.execute",
             start_time=time.time(),
@@ -244,6 +324,8 @@ class TracingMiddleware(Middleware):
         context: Any,
     ) -> dict[str, Any] | None:
         """Pop span, finalize with success status, export if sampled."""
+        if self._disabled:
+            return None
         spans_stack = context.data.get("_tracing_spans", [])
         if not spans_stack:
             _tracing_logger.warning(
@@ -252,6 +334,8 @@ class TracingMiddleware(Middleware):
             )
             return None
         span = spans_stack.pop()
+        if span is _UNSAMPLED:
+            return None
         span.end_time = time.time()
         span.status = "ok"
         span.attributes["duration_ms"] = (span.end_time - span.start_time) * 1000
@@ -263,6 +347,8 @@ class TracingMiddleware(Middleware):
 
     def on_error(self, module_id: str, inputs: dict[str, Any], error: Exception, context: Any) -> dict[str, Any] | None:
         """Pop span, finalize with error status, always export for error_first. Return None."""
+        if self._disabled:
+            return None
         spans_stack = context.data.get("_tracing_spans", [])
         if not spans_stack:
             _tracing_logger.warning(
@@ -271,6 +357,8 @@ class TracingMiddleware(Middleware):
             )
             return None
         span = spans_stack.pop()
+        if span is _UNSAMPLED:
+            return None
         span.end_time = time.time()
         span.status = "error"
         span.attributes["duration_ms"] = (span.end_time - span.start_time) * 1000
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import defaultdict, deque
 
 from apcore.errors import CircularDependencyError, ModuleLoadError
 from apcore.registry.types import DependencyInfo
@@ -36,11 +36,16 @@ def resolve_dependencies(
     if known_ids is None:
         known_ids = {mod_id for mod_id, _ in modules}
 
-    # Build graph and in-degree
-    graph: dict[str, set[str]] = defaultdict(set)
-    in_degree: dict[str, int] = {mod_id: 0 for mod_id, _ in modules}
+    # Nodes are numbered in sorted ID order, so the graph lives in plain lists
+    # and an integer min-heap still pops the smallest ready ID, for determinism.
+    ids = sorted({mod_id for mod_id, _ in modules})
+    index = {mod_id: i for i, mod_id in enumerate(ids)}
+    # Adjacency lists; a repeated dependency adds one edge and one in-degree each time
+    dependents: list[list[int]] = [[] for _ in ids]
+    in_degree = [0] * len(ids)
 
     for module_id, deps in modules:
+        node = index[module_id]
         for dep in deps:
             if dep.module_id not in known_ids:
                 if dep.optional:
@@ -55,24 +60,31 @@ def resolve_dependencies(
                         module_id=module_id,
                         reason=f"Required dependency '{dep.module_id}' not found",
                     )
-            graph[dep.module_id].add(module_id)
-            in_degree[module_id] += 1
+            dep_node = index.get(dep.module_id)
+            if dep_node is not None:
+                dependents[dep_node].append(node)
+            # A known dependency outside this batch is never loaded here, so the
+            # dependent keeps a non-zero in-degree and is reported below.
+            in_degree[node] += 1
 
-    # Initialize queue with zero-in-degree nodes (sorted for determinism)
-    queue: deque[str] = deque(sorted(mod_id for mod_id in in_degree if in_degree[mod_id] == 0))
+    queue: list[int] = [i for i, degree in enumerate(in_degree) if degree == 0]
+    heapq.heapify(queue)
 
-    load_order: list[str] = []
+    order: list[int] = []
     while queue:
-        mod_id = queue.popleft()
-        load_order.append(mod_id)
-        for dependent in sorted(graph.get(mod_id, set())):
+        node = heapq.heappop(queue)
+        order.append(node)
+        for dependent in dependents[node]:
             in_degree[dependent] -= 1
             if in_degree[dependent] == 0:
-                queue.append(dependent)
+                heapq.heappush(queue, dependent)
+
+    load_order = [ids[i] for i in order]
 
     # Check for cycles
     if len(load_order) < len(modules):
-        remaining = {mod_id for mod_id, _ in modules if mod_id not in set(load_order)}
+        loaded = set(load_order)
+        remaining = {mod_id for mod_id, _ in modules if mod_id not in loaded}
         cycle_path = _extract_cycle(modules, remaining)
         raise CircularDependencyError(cycle_path=cycle_path)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import inspect
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +16,14 @@ from apcore.errors import ModuleLoadError
 
 __all__ = ["resolve_entry_point", "snake_to_pascal"]
 
+# Auto-inferred module class per file path, with the (mtime_ns, size) it was
+# inferred at, so an unchanged file is not re-imported and re-scanned on every
+# discovery. An edited file replaces its entry rather than adding one.
+_entry_point_cache: dict[str, tuple[tuple[int, int], type]] = {}
+
+# (file path, mtime_ns, size) of each file imported into sys.modules, by module name.
+_loaded_file_stamps: dict[str, tuple[str, int, int]] = {}
+
 
 def snake_to_pascal(name: str) -> str:
     """Convert a snake_case string to PascalCase."""
@@ -38,9 +49,29 @@ def _is_module_class(cls: type, loaded_module_name: str) -> bool:
     return True
 
 
-def _import_module_from_file(file_path: Path) -> Any:
-    """Dynamically import a Python file and return the loaded module object."""
-    module_name = f"apcore_ext_{file_path.stem}"
+def clear_entry_point_cache() -> None:
+    """Forget the auto-inferred classes and the stamps of imported files."""
+    _entry_point_cache.clear()
+    _loaded_file_stamps.clear()
+
+
+def _import_module_from_file(file_path: Path, stat: os.stat_result | None = None) -> Any:
+    """Dynamically import a Python file and return the loaded module object.
+
+    A module already in ``sys.modules`` for the same, unmodified file is
+    reused instead of being executed again. ``stat`` saves a second stat call
+    when the caller already has one for ``file_path``.
+    """
+    # The path digest keeps same-named files in different directories apart
+    path_digest = hashlib.blake2b(str(file_path.resolve()).encode(), digest_size=4).hexdigest()
+    module_name = f"apcore_ext_{file_path.stem}_{path_digest}"
+    if stat is None:
+        stat = file_path.stat()
+    file_stamp = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    existing = sys.modules.get(module_name)
+    if existing is not None and _loaded_file_stamps.get(module_name) == file_stamp:
+        return existing
+
     spec = importlib.util.spec_from_file_location(module_name, str(file_path))
     if spec is None or spec.loader is None:
         raise ModuleLoadError(
@@ -49,10 +80,14 @@ def _import_module_from_file(file_path: Path) -> Any:
         )
 
     mod = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = mod
     try:
         spec.loader.exec_module(mod)
     except Exception as exc:
+        sys.modules.pop(module_name, None)
+        _loaded_file_stamps.pop(module_name, None)
         raise ModuleLoadError(module_id=str(file_path), reason=f"Failed to import module: {exc}") from exc
+    _loaded_file_stamps[module_name] = file_stamp
     return mod
 
 
@@ -62,10 +97,11 @@ def resolve_entry_point(file_path: Path, meta: dict[str, Any] | None = None) ->
     If meta contains an 'entry_point' key in format 'filename:ClassName',
     loads that specific class. Otherwise auto-infers the single module class.
     """
-    loaded = _import_module_from_file(file_path)
+    stat = file_path.stat()
 
     # Meta override mode
     if meta and "entry_point" in meta:
+        loaded = _import_module_from_file(file_path, stat)
         class_name = meta["entry_point"].split(":")[-1]
         cls = getattr(loaded, class_name, None)
         if cls is None:
@@ -76,11 +112,19 @@ def resolve_entry_point(file_path: Path, meta: dict[str, Any] | None = None) ->
         return cls
 
     # Auto-infer mode
+    path_key = str(file_path)
+    file_stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _entry_point_cache.get(path_key)
+    if cached is not None and cached[0] == file_stamp:
+        return cached[1]
+
+    loaded = _import_module_from_file(file_path, stat)
     candidates = [
-        cls for _, cls in inspect.getmembers(loaded, inspect.isclass) if _is_module_class(cls, loaded.__name__)
+        value for value in vars(loaded).values() if isinstance(value, type) and _is_module_class(value, loaded.__name__)
     ]
 
     if len(candidates) == 1:
+        _entry_point_cache[path_key] = (file_stamp, candidates[0])
         return candidates[0]
     elif len(candidates) == 0:
         raise ModuleLoadError(module_id=str(file_path), reason="No Module subclass found in file")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,14 @@ from apcore.registry.types import DependencyInfo
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed metadata keyed by (path, mtime_ns, size); oldest entries are evicted first.
+_METADATA_CACHE_MAX_ENTRIES = 2000
+_metadata_cache: dict[tuple[str, int, int], dict[str, Any]] = {}
+_metadata_cache_lock = threading.Lock()
+
 __all__ = [
     "load_metadata",
     "parse_dependencies",
@@ -25,21 +34,38 @@ def load_metadata(meta_path: Path) -> dict[str, Any]:
     """Load a *_meta.yaml companion metadata file.
 
     Returns empty dict if file does not exist (metadata is optional).
+    Parsed files are cached by path, mtime and size; each call returns a
+    shallow copy, so callers may add or replace top-level keys.
     """
-    if not meta_path.exists():
+    try:
+        stat = meta_path.stat()
+    except FileNotFoundError:
         return {}
+    if stat.st_size == 0:
+        return {}
+
+    cache_key = (str(meta_path), stat.st_mtime_ns, stat.st_size)
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
-    content = meta_path.read_text(encoding="utf-8")
     try:
-        parsed = yaml.safe_load(content)
+        with meta_path.open("rb") as f:
+            parsed = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ConfigError(message=f"Invalid YAML in metadata file: {meta_path}") from e
 
     if parsed is None:
-        return {}
+        parsed = {}
     if not isinstance(parsed, dict):
         raise ConfigError(message=f"Metadata file must be a YAML mapping: {meta_path}")
-    return parsed
+
+    with _metadata_cache_lock:
+        if len(_metadata_cache) >= _METADATA_CACHE_MAX_ENTRIES:
+            del _metadata_cache[next(iter(_metadata_cache))]
+        _metadata_cache[cache_key] = parsed
+    return dict(parsed)
 
 
 def parse_dependencies(deps_raw: list[dict[str, Any]]) -> list[DependencyInfo]:
@@ -74,6 +100,19 @@ def merge_module_metadata(module_class: type, meta: dict[str, Any]) -> dict[str,
     code_metadata = getattr(module_class, "metadata", {})
     code_docs = getattr(module_class, "documentation", None)
 
+    if not meta:
+        # No companion YAML (the common case): code attributes are the result
+        return {
+            "description": code_desc,
+            "name": code_name,
+            "tags": code_tags or [],
+            "version": code_version,
+            "annotations": code_annotations,
+            "examples": code_examples or [],
+            "metadata": dict(code_metadata or {}),
+            "documentation": code_docs,
+        }
+
     yaml_metadata = meta.get("metadata", {})
     merged_metadata = {**(code_metadata or {}), **(yaml_metadata or {})}
 
@@ -97,9 +136,9 @@ def load_id_map(id_map_path: Path) -> dict[str, dict[str, Any]]:
     if not id_map_path.exists():
         raise ConfigNotFoundError(config_path=str(id_map_path))
 
-    content = id_map_path.read_text(encoding="utf-8")
     try:
-        parsed = yaml.safe_load(content)
+        with id_map_path.open("rb") as f:
+            parsed = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ConfigError(message=f"Invalid YAML in ID map file: {id_map_path}") from e
 
@@ -116,8 +155,11 @@ def load_id_map(id_map_path: Path) -> dict[str, dict[str, Any]]:
         if not file_path:
             logger.warning("ID map entry missing 'file' field, skipping")
             continue
+        class_name = entry.get("class")
         result[file_path] = {
             "id": entry.get("id", file_path),
-            "class": entry.get("class"),
+            "class": class_name,
+            # Entry point override in the companion-metadata form, built once here
+            "entry_point": f"{Path(file_path).stem}:{class_name}" if class_name else None,
         }
     return result
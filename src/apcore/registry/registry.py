@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import os
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterator
 
@@ -13,7 +16,7 @@ from apcore.errors import (
     ModuleNotFoundError,
 )
 from apcore.registry.dependencies import resolve_dependencies
-from apcore.registry.entry_point import resolve_entry_point
+from apcore.registry.entry_point import clear_entry_point_cache, resolve_entry_point
 from apcore.registry.metadata import (
     load_id_map,
     load_metadata,
@@ -21,8 +24,10 @@ from apcore.registry.metadata import (
     parse_dependencies,
 )
 from apcore.registry.scanner import scan_extensions, scan_multi_root
-from apcore.registry.types import DependencyInfo, ModuleDescriptor
+from apcore.registry.types import DependencyInfo, DiscoveredModule, ModuleDescriptor
 from apcore.registry.validation import validate_module
+from apcore.schema.json_schema import cached_model_json_schema
+from apcore.utils.clone import clone_json
 
 if TYPE_CHECKING:
     from apcore.config import Config
@@ -34,13 +39,33 @@ REGISTRY_EVENTS: dict[str, str] = {
     "UNREGISTER": "unregister",
 }
 
+# Below this many metadata files, parsing serially is cheaper than starting a thread pool.
+_PARALLEL_METADATA_MIN_FILES = 8
+
 MODULE_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$")
 
 __all__ = ["Registry", "REGISTRY_EVENTS", "MODULE_ID_PATTERN"]
 
 
+def _copy_descriptor(descriptor: ModuleDescriptor) -> ModuleDescriptor:
+    """Copy a cached descriptor so callers cannot modify the cached schemas or lists."""
+    return dataclasses.replace(
+        descriptor,
+        input_schema=clone_json(descriptor.input_schema),
+        output_schema=clone_json(descriptor.output_schema),
+        tags=list(descriptor.tags),
+        examples=list(descriptor.examples),
+        metadata=clone_json(descriptor.metadata),
+    )
+
+
 class Registry:
-    """Central module registry for discovering, registering, and querying modules."""
+    """Central module registry for discovering, registering, and querying modules.
+
+    Mutations are serialized by an internal lock. Read-only queries do not
+    take the lock: single dict reads and ``dict.copy()`` are atomic, so
+    ``list``, ``iter`` and ``module_ids`` see a consistent snapshot.
+    """
 
     def __init__(
         self,
@@ -77,6 +102,10 @@ class Registry:
         else:
             self._extension_roots = [{"root": "./extensions"}]
 
+        # Absolute extension root prefixes (ending in a separator), used to match
+        # discovered files against ID map entries with a plain string test
+        self._root_prefixes: list[str] = [os.path.join(Path(r["root"]).resolve(), "") for r in self._extension_roots]
+
         # Internal state
         self._modules: dict[str, Any] = {}
         self._module_meta: dict[str, dict[str, Any]] = {}
@@ -86,7 +115,11 @@ class Registry:
         }
         self._lock = threading.RLock()
         self._id_map: dict[str, dict[str, Any]] = {}
-        self._schema_cache: dict[str, dict[str, Any]] = {}
+        self._schema_cache: dict[str, ModuleDescriptor] = {}
+        # Inverted tag index (tag -> module IDs) and each module's indexed tags,
+        # maintained on register/unregister so tag queries avoid scanning modules
+        self._tag_index: dict[str, set[str]] = {}
+        self._module_tags: dict[str, frozenset[str]] = {}
         self._config = config
 
         # Load ID map if provided
@@ -129,71 +162,57 @@ class Registry:
             )
 
         # Step 2: Apply ID Map overrides
+        entry_point_overrides: dict[str, str] = {}
         if self._id_map:
-            resolved_roots = [Path(r["root"]).resolve() for r in self._extension_roots]
             for dm in discovered:
                 rel_path = None
-                for root in resolved_roots:
-                    try:
-                        rel_path = str(dm.file_path.relative_to(root))
+                file_str = str(dm.file_path)
+                for prefix in self._root_prefixes:
+                    if file_str.startswith(prefix):
+                        rel_path = file_str[len(prefix) :]
                         break
-                    except ValueError:
-                        continue
                 if rel_path and rel_path in self._id_map:
                     map_entry = self._id_map[rel_path]
                     dm.canonical_id = map_entry["id"]
+                    if map_entry["entry_point"]:
+                        entry_point_overrides[dm.canonical_id] = map_entry["entry_point"]
 
         # Step 3: Load metadata for each discovered module
-        raw_metadata: dict[str, dict[str, Any]] = {}
-        for dm in discovered:
-            if dm.meta_path:
-                raw_metadata[dm.canonical_id] = load_metadata(dm.meta_path)
-            else:
-                raw_metadata[dm.canonical_id] = {}
+        raw_metadata = self._load_all_metadata(discovered)
 
-        # Step 4: Resolve entry points
-        resolved_classes: dict[str, type] = {}
+        # Steps 4-6: Resolve entry points, validate, and collect dependencies in one pass
+        records: dict[str, tuple[type, dict[str, Any]]] = {}
+        modules_with_deps: list[tuple[str, list[DependencyInfo]]] = []
         for dm in discovered:
-            meta = raw_metadata.get(dm.canonical_id, {})
+            mod_id = dm.canonical_id
+            meta = raw_metadata.get(mod_id, {})
             # Inject class override from ID map
-            if dm.canonical_id in self._id_map:
-                map_entry = self._id_map[dm.canonical_id]
-                if map_entry.get("class"):
-                    stem = dm.file_path.stem
-                    meta.setdefault("entry_point", f"{stem}:{map_entry['class']}")
+            override = entry_point_overrides.get(mod_id)
+            if override is not None:
+                meta.setdefault("entry_point", override)
             try:
                 cls = resolve_entry_point(dm.file_path, meta=meta)
             except Exception as e:
-                logger.warning("Failed to resolve entry point for '%s': %s", dm.canonical_id, e)
+                logger.warning("Failed to resolve entry point for '%s': %s", mod_id, e)
                 continue
-            resolved_classes[dm.canonical_id] = cls
 
-        # Step 5: Validate module classes
-        valid_classes: dict[str, type] = {}
-        for mod_id, cls in resolved_classes.items():
             errors = validate_module(cls)
             if errors:
                 logger.warning("Module '%s' failed validation: %s", mod_id, "; ".join(errors))
                 continue
-            valid_classes[mod_id] = cls
 
-        # Step 6: Collect dependencies
-        modules_with_deps: list[tuple[str, list[DependencyInfo]]] = []
-        for mod_id in valid_classes:
-            meta = raw_metadata.get(mod_id, {})
             deps_raw = meta.get("dependencies", [])
             deps = parse_dependencies(deps_raw) if deps_raw else []
+            records[mod_id] = (cls, meta)
             modules_with_deps.append((mod_id, deps))
 
         # Step 7: Resolve dependency order (may raise CircularDependencyError)
-        known_ids = {mod_id for mod_id, _ in modules_with_deps}
-        load_order = resolve_dependencies(modules_with_deps, known_ids=known_ids)
+        load_order = resolve_dependencies(modules_with_deps, known_ids=set(records))
 
         # Step 8: Instantiate and register in dependency order
         registered_count = 0
         for mod_id in load_order:
-            cls = valid_classes[mod_id]
-            meta = raw_metadata.get(mod_id, {})
+            cls, meta = records[mod_id]
             try:
                 module = cls()
             except Exception as e:
@@ -205,6 +224,8 @@ class Registry:
             with self._lock:
                 self._modules[mod_id] = module
                 self._module_meta[mod_id] = merged_meta
+                self._schema_cache.pop(mod_id, None)
+                self._unindex_tags(mod_id)
 
             # Call on_load if available
             if hasattr(module, "on_load") and callable(module.on_load):
@@ -217,6 +238,8 @@ class Registry:
                         self._module_meta.pop(mod_id, None)
                     continue
 
+            self._index_loaded_module(mod_id, module, merged_meta)
+
             self._trigger_event("register", mod_id, module)
             registered_count += 1
 
@@ -230,6 +253,27 @@ class Registry:
 
         return registered_count
 
+    @staticmethod
+    def _load_all_metadata(discovered: list[DiscoveredModule]) -> dict[str, dict[str, Any]]:
+        """Load companion metadata for discovered modules, keyed by canonical ID.
+
+        Files are parsed on a thread pool when there are enough of them;
+        modules without a metadata file get an empty dict.
+        """
+        meta_paths = [dm.meta_path for dm in discovered if dm.meta_path]
+        if len(meta_paths) < _PARALLEL_METADATA_MIN_FILES:
+            loaded = [load_metadata(path) for path in meta_paths]
+        else:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                loaded = list(pool.map(load_metadata, meta_paths))
+
+        loaded_iter = iter(loaded)
+        raw_metadata: dict[str, dict[str, Any]] = {}
+        for dm in discovered:
+            raw_metadata[dm.canonical_id] = next(loaded_iter) if dm.meta_path else {}
+        return raw_metadata
+
     # ----- Manual Registration -----
 
     def register(self, module_id: str, module: Any) -> None:
@@ -266,6 +310,8 @@ class Registry:
                     self._modules.pop(module_id, None)
                 raise
 
+        self._index_loaded_module(module_id, module, {})
+
         self._trigger_event("register", module_id, module)
 
     def unregister(self, module_id: str) -> bool:
@@ -279,6 +325,7 @@ class Registry:
             module = self._modules.pop(module_id)
             self._module_meta.pop(module_id, None)
             self._schema_cache.pop(module_id, None)
+            self._unindex_tags(module_id)
 
         # Call on_unload if available
         if hasattr(module, "on_unload") and callable(module.on_unload):
@@ -290,6 +337,36 @@ class Registry:
         self._trigger_event("unregister", module_id, module)
         return True
 
+    def _index_loaded_module(self, module_id: str, module: Any, meta: dict[str, Any]) -> None:
+        """Index a module's tags once ``on_load`` has run, unless it was replaced meanwhile."""
+        with self._lock:
+            if self._modules.get(module_id) is module:
+                self._index_tags(module_id, module, meta)
+
+    def _index_tags(self, module_id: str, module: Any, meta: dict[str, Any]) -> None:
+        """Record a module's code and metadata tags in the tag index.
+
+        Must be called with ``self._lock`` held.
+        """
+        self._unindex_tags(module_id)
+        tags = set(getattr(module, "tags", []) or [])
+        meta_tags = meta.get("tags")
+        if meta_tags:
+            tags.update(meta_tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(module_id)
+        self._module_tags[module_id] = frozenset(tags)
+
+    def _unindex_tags(self, module_id: str) -> None:
+        """Remove a module from the tag index. Must be called with ``self._lock`` held."""
+        for tag in self._module_tags.pop(module_id, ()):
+            posting = self._tag_index.get(tag)
+            if posting is None:
+                continue
+            posting.discard(module_id)
+            if not posting:
+                del self._tag_index[tag]
+
     # ----- Query Methods -----
 
     def get(self, module_id: str) -> Any:
@@ -300,66 +377,60 @@ class Registry:
         """
         if module_id == "":
             raise ModuleNotFoundError(module_id="")
-        with self._lock:
-            return self._modules.get(module_id)
+        return self._modules.get(module_id)
 
     def has(self, module_id: str) -> bool:
         """Check whether a module is registered."""
-        with self._lock:
-            return module_id in self._modules
+        return module_id in self._modules
 
     def list(self, tags: list[str] | None = None, prefix: str | None = None) -> list[str]:
-        """Return sorted list of registered module IDs, optionally filtered."""
-        with self._lock:
-            snapshot = dict(self._modules)
-            meta_snapshot = dict(self._module_meta)
+        """Return sorted list of registered module IDs, optionally filtered.
 
-        ids = list(snapshot.keys())
+        Tag filtering uses the tags each module had when it was registered,
+        read after its ``on_load`` returned. Tags changed on a module later are
+        not seen until it is registered again.
+        """
+        ids = list(self._modules.copy())
 
         if prefix is not None:
             ids = [mid for mid in ids if mid.startswith(prefix)]
 
-        if tags is not None:
-            tag_set = set(tags)
-
-            def has_all_tags(mid: str) -> bool:
-                mod = snapshot[mid]
-                # Check module-level tags attribute
-                mod_tags = set(getattr(mod, "tags", []) or [])
-                # Also check merged metadata tags
-                meta_tags = meta_snapshot.get(mid, {}).get("tags", [])
-                if meta_tags:
-                    mod_tags.update(meta_tags)
-                return tag_set.issubset(mod_tags)
-
-            ids = [mid for mid in ids if has_all_tags(mid)]
+        if tags:
+            # Intersect the tag index postings, smallest first, instead of checking every module
+            postings = sorted((self._tag_index.get(tag, set()) for tag in set(tags)), key=len)
+            matching = set(postings[0]).intersection(*postings[1:])
+            ids = [mid for mid in ids if mid in matching]
 
         return sorted(ids)
 
     def iter(self) -> Iterator[tuple[str, Any]]:
         """Return an iterator of (module_id, module) tuples (snapshot-based)."""
-        with self._lock:
-            items = list(self._modules.items())
-        return iter(items)
+        return iter(list(self._modules.copy().items()))
 
     @property
     def count(self) -> int:
         """Number of registered modules."""
-        with self._lock:
-            return len(self._modules)
+        return len(self._modules)
 
     @property
     def module_ids(self) -> list[str]:
         """Sorted list of registered module IDs."""
-        with self._lock:
-            return sorted(self._modules.keys())
+        return sorted(self._modules.copy())
 
     def get_definition(self, module_id: str) -> ModuleDescriptor | None:
-        """Get a ModuleDescriptor for a registered module. Returns None if not found."""
+        """Get a ModuleDescriptor for a registered module. Returns None if not found.
+
+        Descriptors are cached per module ID until the module is unregistered
+        or replaced. Each call returns a copy whose schemas, tags, examples and
+        metadata can be modified without affecting later calls.
+        """
         with self._lock:
             module = self._modules.get(module_id)
             if module is None:
                 return None
+            cached = self._schema_cache.get(module_id)
+            if cached is not None:
+                return _copy_descriptor(cached)
             meta = dict(self._module_meta.get(module_id, {}))
 
         cls = type(module)
@@ -367,10 +438,10 @@ class Registry:
         input_schema_cls = getattr(module, "input_schema", None) or getattr(cls, "input_schema", None)
         output_schema_cls = getattr(module, "output_schema", None) or getattr(cls, "output_schema", None)
 
-        input_json = input_schema_cls.model_json_schema() if input_schema_cls else {}
-        output_json = output_schema_cls.model_json_schema() if output_schema_cls else {}
+        input_json = cached_model_json_schema(input_schema_cls) if input_schema_cls else {}
+        output_json = cached_model_json_schema(output_schema_cls) if output_schema_cls else {}
 
-        return ModuleDescriptor(
+        descriptor = ModuleDescriptor(
             module_id=module_id,
             name=meta.get("name") or getattr(module, "name", None),
             description=meta.get("description") or getattr(module, "description", ""),
@@ -383,6 +454,11 @@ class Registry:
             examples=list(getattr(module, "examples", []) or []),
             metadata=meta.get("metadata", {}),
         )
+        with self._lock:
+            # Only cache if the module was not replaced while the schemas were built
+            if self._modules.get(module_id) is module:
+                self._schema_cache[module_id] = descriptor
+        return _copy_descriptor(descriptor)
 
     # ----- Event System -----
 
@@ -419,6 +495,7 @@ class Registry:
     # ----- Cache -----
 
     def clear_cache(self) -> None:
-        """Clear the schema cache."""
+        """Clear the schema cache and the process-wide entry point cache."""
         with self._lock:
             self._schema_cache.clear()
+        clear_entry_point_cache()
@@ -15,7 +15,6 @@ logger = logging.getLogger(__name__)
 __all__ = ["scan_extensions", "scan_multi_root"]
 
 _SKIP_DIR_NAMES = {"__pycache__", "node_modules"}
-_SKIP_FILE_SUFFIXES = {".pyc"}
 
 
 def scan_extensions(
@@ -24,28 +23,50 @@ def scan_extensions(
     follow_symlinks: bool = False,
 ) -> list[DiscoveredModule]:
     """Recursively scan an extensions directory for Python module files."""
+    results: list[DiscoveredModule] = []
+    _scan_root(root, max_depth, follow_symlinks, None, results, {}, {})
+    return results
+
+
+def _scan_root(
+    root: Path,
+    max_depth: int,
+    follow_symlinks: bool,
+    namespace: str | None,
+    results: list[DiscoveredModule],
+    seen_ids: dict[str, Path],
+    seen_ids_lower: dict[str, str],
+) -> None:
+    """Scan one extension root, appending its modules to ``results``.
+
+    Canonical IDs are prefixed with ``namespace`` when given. ``seen_ids`` and
+    ``seen_ids_lower`` may be shared between roots so duplicates and case
+    collisions are reported across all of them.
+    """
     root = Path(root).resolve()
     if not root.exists():
         raise ConfigNotFoundError(config_path=str(root))
 
     visited_real_paths: set[Path] = {root.resolve()}
-    results: list[DiscoveredModule] = []
-    seen_ids: dict[str, Path] = {}
-    seen_ids_lower: dict[str, str] = {}
 
-    def _scan_dir(dir_path: Path, depth: int) -> None:
-        if depth > max_depth:
-            logger.info("Max depth %d exceeded at %s, skipping", max_depth, dir_path)
-            return
+    def _scan_dir(dir_path: Path, id_parts: tuple[str, ...]) -> list[tuple[Path, tuple[str, ...]]]:
+        """Collect module files in one directory and return its subdirectories to scan.
 
+        ``id_parts`` holds the directory names from ``root`` down to ``dir_path``,
+        which prefix the canonical IDs of modules found here.
+        """
+        subdirs: list[tuple[Path, tuple[str, ...]]] = []
         try:
             entries = list(os.scandir(dir_path))
         except PermissionError as e:
             logger.error("Permission denied scanning %s: %s", dir_path, e)
-            return
+            return subdirs
         except OSError as e:
             logger.error("OS error scanning %s: %s", dir_path, e)
-            return
+            return subdirs
+
+        # Names in this directory, for companion-metadata lookups without extra stat calls
+        entry_names = {entry.name for entry in entries}
 
         for entry in entries:
             name = entry.name
@@ -54,20 +75,22 @@ def scan_extensions(
             if name in _SKIP_DIR_NAMES:
                 continue
 
+            # DirEntry answers these from the cached dirent type where possible;
+            # only ask the questions this entry actually needs.
             try:
                 is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
-                is_file = entry.is_file(follow_symlinks=follow_symlinks)
-                is_symlink = entry.is_symlink()
+                is_file = not is_dir and entry.is_file(follow_symlinks=follow_symlinks)
+                is_symlink = is_dir and entry.is_symlink()
             except OSError as e:
                 logger.error("OS error accessing %s: %s", entry.path, e)
                 continue
 
-            entry_path = Path(entry.path)
-
             if is_dir:
+                if is_symlink and not follow_symlinks:
+                    continue
+                # Path objects are built only for entries that pass the string filters
+                entry_path = Path(entry.path)
                 if is_symlink:
-                    if not follow_symlinks:
-                        continue
                     real = entry_path.resolve()
                     if real in visited_real_paths:
                         logger.warning(
@@ -77,16 +100,14 @@ def scan_extensions(
                         )
                         continue
                     visited_real_paths.add(real)
-                _scan_dir(entry_path, depth + 1)
+                subdirs.append((entry_path, (*id_parts, name)))
             elif is_file:
-                suffix = Path(name).suffix
-                if suffix in _SKIP_FILE_SUFFIXES:
-                    continue
-                if suffix != ".py":
+                # Plain string test; this also rejects compiled ".pyc" files
+                if not name.endswith(".py"):
                     continue
-
-                rel = entry_path.relative_to(root)
-                canonical_id = str(rel.with_suffix("")).replace(os.sep, ".")
+                entry_path = Path(entry.path)
+                stem = name[: -len(".py")]
+                canonical_id = ".".join((*id_parts, stem))
 
                 if canonical_id in seen_ids:
                     logger.error(
@@ -105,22 +126,30 @@ def scan_extensions(
                         seen_ids_lower[lower_id],
                     )
 
-                meta_path = entry_path.with_name(entry_path.stem + "_meta.yaml")
-                if not meta_path.exists():
-                    meta_path = None
+                meta_name = stem + "_meta.yaml"
+                meta_path = entry_path.with_name(meta_name) if meta_name in entry_names else None
 
                 dm = DiscoveredModule(
                     file_path=entry_path,
                     canonical_id=canonical_id,
                     meta_path=meta_path,
-                    namespace=None,
+                    namespace=namespace,
                 )
                 seen_ids[canonical_id] = entry_path
                 seen_ids_lower[lower_id] = canonical_id
                 results.append(dm)
+        return subdirs
 
-    _scan_dir(root, depth=1)
-    return results
+    # Iterative depth-first walk; subdirectories are pushed in reverse so they
+    # are visited in directory-listing order.
+    stack: list[tuple[Path, int, tuple[str, ...]]] = [(root, 1, (namespace,) if namespace else ())]
+    while stack:
+        dir_path, depth, id_parts = stack.pop()
+        if depth > max_depth:
+            logger.info("Max depth %d exceeded at %s, skipping", max_depth, dir_path)
+            continue
+        subdirs = _scan_dir(dir_path, id_parts)
+        stack.extend((subdir, depth + 1, parts) for subdir, parts in reversed(subdirs))
 
 
 def scan_multi_root(
@@ -142,16 +171,10 @@ def scan_multi_root(
         seen_namespaces.add(namespace)
         resolved.append((root_path, namespace))
 
+    # Seen IDs are shared so duplicates are detected across roots, not just within one
+    seen_ids: dict[str, Path] = {}
+    seen_ids_lower: dict[str, str] = {}
     for root_path, namespace in resolved:
-        modules = scan_extensions(root_path, max_depth=max_depth, follow_symlinks=follow_symlinks)
-        for m in modules:
-            all_results.append(
-                DiscoveredModule(
-                    file_path=m.file_path,
-                    canonical_id=f"{namespace}.{m.canonical_id}",
-                    meta_path=m.meta_path,
-                    namespace=namespace,
-                )
-            )
+        _scan_root(root_path, max_depth, follow_symlinks, namespace, all_results, seen_ids, seen_ids_lower)
 
     return all_results
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import copy
 import dataclasses
 import json
+import re
 from typing import TYPE_CHECKING, Any
 
 import yaml
@@ -12,14 +12,35 @@ import yaml
 from apcore.errors import ModuleNotFoundError
 from apcore.module import ModuleAnnotations, ModuleExample
 from apcore.schema.exporter import SchemaExporter
-from apcore.schema.strict import _strip_extensions, to_strict_schema
+from apcore.schema.strict import _copy_without_extensions, to_strict_schema
 from apcore.schema.types import ExportProfile, SchemaDefinition
+from apcore.utils.clone import clone_json
 
 if TYPE_CHECKING:
     from apcore.registry.registry import Registry
 
 __all__ = ["get_schema", "export_schema", "get_all_schemas", "export_all_schemas"]
 
+# Field names walked by _dataclass_to_dict, resolved once at import
+_ANNOTATION_FIELDS = tuple(f.name for f in dataclasses.fields(ModuleAnnotations))
+_EXAMPLE_FIELDS = tuple(f.name for f in dataclasses.fields(ModuleExample))
+
+# Profile lookup by value (and by member, since ExportProfile members hash by name)
+_PROFILES: dict[Any, ExportProfile] = {**{p.value: p for p in ExportProfile}, **{p: p for p in ExportProfile}}
+
+# SchemaExporter is stateless, so one instance serves every export
+_EXPORTER = SchemaExporter()
+
+# Top-level keys compact mode removes, and the schemas it strips of x-* keys
+_COMPACT_DROPPED_KEYS = frozenset({"documentation", "examples"})
+_COMPACT_SCHEMA_KEYS = frozenset({"input_schema", "output_schema"})
+
+# End of the first sentence for compact descriptions
+_SENTENCE_END = re.compile(r"\. |\n")
+
+# libyaml emitter when available; same representers as the default yaml.Dumper
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 def get_schema(registry: Registry, module_id: str) -> dict[str, Any] | None:
     """Build a structured schema dict from a registered module's attributes.
@@ -29,27 +50,7 @@ def get_schema(registry: Registry, module_id: str) -> dict[str, Any] | None:
     module = registry.get(module_id)
     if module is None:
         return None
-
-    input_schema_dict = module.input_schema.model_json_schema()
-    output_schema_dict = module.output_schema.model_json_schema()
-
-    annotations = getattr(module, "annotations", None)
-    annotations_dict = dataclasses.asdict(annotations) if isinstance(annotations, ModuleAnnotations) else None
-
-    examples_raw = getattr(module, "examples", []) or []
-    examples_list = [dataclasses.asdict(ex) for ex in examples_raw if isinstance(ex, ModuleExample)]
-
-    return {
-        "module_id": module_id,
-        "name": getattr(module, "name", None),
-        "description": getattr(module, "description", ""),
-        "version": getattr(module, "version", "1.0.0"),
-        "tags": list(getattr(module, "tags", []) or []),
-        "input_schema": input_schema_dict,
-        "output_schema": output_schema_dict,
-        "annotations": annotations_dict,
-        "examples": examples_list,
-    }
+    return _build_schema(registry, module_id, module)
 
 
 def export_schema(
@@ -64,29 +65,28 @@ def export_schema(
 
     Raises ModuleNotFoundError if the module_id is not registered.
     """
-    schema_dict = get_schema(registry, module_id)
+    module = registry.get(module_id)
+    schema_dict = _build_schema(registry, module_id, module) if module is not None else None
     if schema_dict is None:
         raise ModuleNotFoundError(module_id=module_id)
 
     if profile is not None:
-        return _export_with_profile(registry, module_id, schema_dict, profile, format)
-
-    result = copy.deepcopy(schema_dict)
+        return _export_with_profile(module, schema_dict, profile, format)
 
     if strict:
-        result["input_schema"] = to_strict_schema(result["input_schema"])
-        result["output_schema"] = to_strict_schema(result["output_schema"])
+        schema_dict = _apply_strict(schema_dict)
     elif compact:
-        _apply_compact(result)
+        schema_dict = _apply_compact(schema_dict)
 
-    return _serialize(result, format)
+    return _serialize(schema_dict, format)
 
 
 def get_all_schemas(registry: Registry) -> dict[str, dict[str, Any]]:
     """Collect schema dicts for all registered modules."""
     result: dict[str, dict[str, Any]] = {}
-    for module_id in registry.module_ids:
-        schema = get_schema(registry, module_id)
+    # One snapshot of (id, module) pairs, sorted by ID, instead of a get() per module
+    for module_id, module in sorted(registry.iter(), key=lambda item: item[0]):
+        schema = _build_schema(registry, module_id, module)
         if schema is not None:
             result[module_id] = schema
     return result
@@ -102,15 +102,10 @@ def export_all_schemas(
     """Export all module schemas as a combined JSON or YAML string."""
     all_schemas = get_all_schemas(registry)
 
-    if strict or compact:
-        for module_id, schema in all_schemas.items():
-            result = copy.deepcopy(schema)
-            if strict:
-                result["input_schema"] = to_strict_schema(result["input_schema"])
-                result["output_schema"] = to_strict_schema(result["output_schema"])
-            elif compact:
-                _apply_compact(result)
-            all_schemas[module_id] = result
+    if strict:
+        all_schemas = {module_id: _apply_strict(schema) for module_id, schema in all_schemas.items()}
+    elif compact:
+        all_schemas = {module_id: _apply_compact(schema) for module_id, schema in all_schemas.items()}
 
     return _serialize(all_schemas, format)
 
@@ -118,72 +113,114 @@ def export_all_schemas(
 # ----- Helpers -----
 
 
+def _build_schema(registry: Registry, module_id: str, module: Any) -> dict[str, Any] | None:
+    """Build the schema dict for an already looked-up module; see ``get_schema``."""
+    # Reuses the schemas built by model_json_schema() until the module is re-registered
+    definition = registry.get_definition(module_id)
+    if definition is None:
+        return None
+
+    annotations = getattr(module, "annotations", None)
+    annotations_dict = (
+        _dataclass_to_dict(annotations, _ANNOTATION_FIELDS) if isinstance(annotations, ModuleAnnotations) else None
+    )
+
+    examples_raw = getattr(module, "examples", None) or ()
+    examples_list = [_dataclass_to_dict(ex, _EXAMPLE_FIELDS) for ex in examples_raw if isinstance(ex, ModuleExample)]
+
+    return {
+        "module_id": module_id,
+        "name": getattr(module, "name", None),
+        "description": getattr(module, "description", ""),
+        "version": getattr(module, "version", "1.0.0"),
+        "tags": list(getattr(module, "tags", None) or ()),
+        "input_schema": definition.input_schema,
+        "output_schema": definition.output_schema,
+        "annotations": annotations_dict,
+        "examples": examples_list,
+    }
+
+
 def _export_with_profile(
-    registry: Registry,
-    module_id: str,
+    module: Any,
     schema_dict: dict[str, Any],
     profile: str,
     format: str,
 ) -> str:
     """Export using SchemaExporter with a specific profile."""
     schema_def = SchemaDefinition(
-        module_id=module_id,
+        module_id=schema_dict["module_id"],
         description=schema_dict["description"],
         input_schema=schema_dict["input_schema"],
         output_schema=schema_dict["output_schema"],
         definitions={},
     )
-    module = registry.get(module_id)
-    annotations = getattr(module, "annotations", None) if module else None
-    examples = getattr(module, "examples", []) if module else []
-    name = getattr(module, "name", None) if module else None
 
-    exported = SchemaExporter().export(
+    export_profile = _PROFILES.get(profile)
+    if export_profile is None:
+        raise ValueError(f"{profile!r} is not a valid ExportProfile")
+
+    exported = _EXPORTER.export(
         schema_def,
-        profile=ExportProfile(profile),
-        annotations=annotations,
-        examples=examples,
-        name=name,
+        profile=export_profile,
+        annotations=getattr(module, "annotations", None),
+        examples=getattr(module, "examples", []),
+        name=schema_dict["name"],
     )
     return _serialize(exported, format)
 
 
-def _apply_compact(schema_dict: dict[str, Any]) -> None:
-    """Apply compact mode transformations in place."""
-    # Truncate description
-    desc = schema_dict.get("description", "")
-    if desc:
-        schema_dict["description"] = _truncate_description(desc)
+def _dataclass_to_dict(obj: Any, field_names: tuple[str, ...]) -> dict[str, Any]:
+    """``dataclasses.asdict`` for flat dataclasses of JSON-like values.
 
-    # Strip x-* keys from schemas
-    _strip_extensions(schema_dict.get("input_schema", {}))
-    _strip_extensions(schema_dict.get("output_schema", {}))
+    Field values are copied with ``clone_json``, so callers can modify the
+    returned example ``inputs``/``output`` dicts without touching the module.
+    """
+    return {name: clone_json(getattr(obj, name)) for name in field_names}
 
-    # Remove documentation and examples
-    schema_dict.pop("documentation", None)
-    schema_dict.pop("examples", None)
 
+def _apply_strict(schema_dict: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy with strict input/output schemas; ``schema_dict`` is not modified.
 
-def _truncate_description(description: str) -> str:
-    """Truncate description to the first sentence."""
-    dot_space = description.find(". ")
-    newline = description.find("\n")
+    ``to_strict_schema`` already returns new schemas, so only the top level is copied.
+    """
+    result = dict(schema_dict)
+    result["input_schema"] = to_strict_schema(schema_dict["input_schema"])
+    result["output_schema"] = to_strict_schema(schema_dict["output_schema"])
+    return result
 
-    candidates = []
-    if dot_space >= 0:
-        candidates.append(dot_space + 1)  # include the period
-    if newline >= 0:
-        candidates.append(newline)
 
-    if candidates:
-        cut = min(candidates)
-        return description[:cut].rstrip()
+def _apply_compact(schema_dict: dict[str, Any]) -> dict[str, Any]:
+    """Return a compact copy of ``schema_dict``, which is not modified.
 
-    return description
+    Built in one pass over the top-level keys: the description is cut to its
+    first sentence, input/output schemas are copied without x-* keys, and
+    documentation and examples are dropped. Other values are shared.
+    """
+    result: dict[str, Any] = {}
+    for key, value in schema_dict.items():
+        if key in _COMPACT_DROPPED_KEYS:
+            continue
+        if key in _COMPACT_SCHEMA_KEYS:
+            value = _copy_without_extensions(value)
+        elif key == "description" and value:
+            value = _truncate_description(value)
+        result[key] = value
+    return result
+
+
+def _truncate_description(description: str) -> str:
+    """Truncate description to the first sentence."""
+    # One scan that stops at the earlier of the first ". " and the first newline
+    match = _SENTENCE_END.search(description)
+    if match is None:
+        return description
+    cut = match.start() + 1 if match.group() == ". " else match.start()  # keep the period
+    return description[:cut].rstrip()
 
 
 def _serialize(data: Any, format: str) -> str:
     """Serialize data to JSON or YAML string."""
     if format == "yaml":
-        return yaml.dump(data, default_flow_style=False)
+        return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False)
     return json.dumps(data, indent=2)
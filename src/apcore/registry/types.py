@@ -15,7 +15,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleDescriptor:
     """Cross-language compatible module descriptor."""
 
@@ -32,7 +32,7 @@ class ModuleDescriptor:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredModule:
     """Intermediate representation of a discovered module file."""
 
@@ -42,7 +42,7 @@ class DiscoveredModule:
     namespace: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyInfo:
     """Parsed dependency information from module metadata."""
 
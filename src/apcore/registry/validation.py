@@ -3,20 +3,38 @@
 from __future__ import annotations
 
 import inspect
+import weakref
 from typing import Any
 
 from pydantic import BaseModel
 
 __all__ = ["validate_module"]
 
+# Validation errors per module class; weak keys let reloaded/dynamic classes be collected.
+_validation_cache: weakref.WeakKeyDictionary[type, tuple[str, ...]] = weakref.WeakKeyDictionary()
+
 
 def validate_module(module_or_class: type | Any) -> list[str]:
     """Validate that a module class implements the required module interface.
 
     Accepts a class or an instance. If passed an instance, validates type(instance).
     Returns a list of validation error strings. Empty list means valid.
+
+    Results are cached per class, on the assumption that a class's
+    interface attributes do not change after it is first validated.
     """
     cls = module_or_class if inspect.isclass(module_or_class) else type(module_or_class)
+    cached = _validation_cache.get(cls)
+    if cached is not None:
+        return list(cached)
+
+    errors = _check_module_class(cls)
+    _validation_cache[cls] = tuple(errors)
+    return errors
+
+
+def _check_module_class(cls: type) -> list[str]:
+    """Run the interface checks for ``validate_module`` on a class."""
     errors: list[str] = []
 
     # Check input_schema
@@ -9,6 +9,8 @@ from apcore.module import ModuleAnnotations, ModuleExample
 __all__ = ["merge_annotations", "merge_examples", "merge_metadata"]
 
 _ANNOTATION_FIELDS = frozenset(ModuleAnnotations.__dataclass_fields__.keys())
+_DEFAULT_ANNOTATIONS = ModuleAnnotations()
+_EXAMPLE_FIELDS = frozenset(ModuleExample.__dataclass_fields__.keys())
 
 
 def merge_annotations(
@@ -16,18 +18,15 @@ def merge_annotations(
     code_annotations: ModuleAnnotations | None,
 ) -> ModuleAnnotations:
     """Merge YAML and code annotations with priority: YAML > code > defaults."""
-    defaults = ModuleAnnotations()
-    values: dict[str, Any] = {f: getattr(defaults, f) for f in _ANNOTATION_FIELDS}
+    base = code_annotations if code_annotations is not None else _DEFAULT_ANNOTATIONS
+    overrides = {k: v for k, v in yaml_annotations.items() if k in _ANNOTATION_FIELDS} if yaml_annotations else {}
 
-    if code_annotations is not None:
-        for f in _ANNOTATION_FIELDS:
-            values[f] = getattr(code_annotations, f)
-
-    if yaml_annotations is not None:
-        for key, val in yaml_annotations.items():
-            if key in _ANNOTATION_FIELDS:
-                values[key] = val
+    # ModuleAnnotations is frozen, so an unchanged instance can be returned as is
+    if not overrides and type(base) is ModuleAnnotations:
+        return base
 
+    values: dict[str, Any] = {f: getattr(base, f) for f in _ANNOTATION_FIELDS}
+    values.update(overrides)
     return ModuleAnnotations(**values)
 
 
@@ -37,20 +36,25 @@ def merge_examples(
 ) -> list[ModuleExample]:
     """Merge YAML and code examples. YAML takes full priority when present."""
     if yaml_examples is not None:
-        return [
-            ModuleExample(
-                title=d["title"],
-                inputs=d.get("inputs", {}),
-                output=d.get("output", {}),
-                description=d.get("description"),
-            )
-            for d in yaml_examples
-        ]
+        return [_example_from_dict(d) for d in yaml_examples]
     if code_examples is not None:
         return code_examples
     return []
 
 
+def _example_from_dict(d: dict[str, Any]) -> ModuleExample:
+    """Build a ModuleExample from a YAML example dict, ignoring unknown keys."""
+    # Common case: only known fields, so the dict can be unpacked directly
+    if "title" in d and d.keys() <= _EXAMPLE_FIELDS:
+        return ModuleExample(**d)
+    return ModuleExample(
+        title=d["title"],
+        inputs=d.get("inputs", {}),
+        output=d.get("output", {}),
+        description=d.get("description"),
+    )
+
+
 def merge_metadata(
     yaml_metadata: dict[str, Any] | None,
     code_metadata: dict[str, Any] | None,
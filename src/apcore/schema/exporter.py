@@ -8,8 +8,8 @@ from typing import Any
 from apcore.module import ModuleAnnotations, ModuleExample
 from apcore.schema.strict import (
     _apply_llm_descriptions,
+    _make_strict,
     _strip_extensions,
-    to_strict_schema,
 )
 from apcore.schema.types import ExportProfile, SchemaDefinition
 
@@ -57,9 +57,10 @@ class SchemaExporter:
 
     def export_openai(self, schema_def: SchemaDefinition) -> dict[str, Any]:
         """Export in OpenAI function calling format with strict mode."""
-        schema = copy.deepcopy(schema_def.input_schema)
-        _apply_llm_descriptions(schema)
-        strict_schema = to_strict_schema(schema)
+        # One private copy is transformed in place; to_strict_schema would copy it again
+        strict_schema = copy.deepcopy(schema_def.input_schema)
+        _apply_llm_descriptions(strict_schema)
+        _make_strict(strict_schema)
         return {
             "type": "function",
             "function": {
@@ -0,0 +1,30 @@
+"""Cached ``model_json_schema()`` output for Pydantic model classes."""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from apcore.utils.clone import clone_json
+
+__all__ = ["cached_model_json_schema"]
+
+# model_json_schema() output per model class, shared by every module, registry
+# and loader using it. Callers only ever see copies.
+_json_schema_cache: weakref.WeakKeyDictionary[type, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def cached_model_json_schema(schema_cls: Any) -> dict[str, Any]:
+    """Return a fresh copy of ``schema_cls.model_json_schema()``.
+
+    The schema is generated once per class; each call copies the cached dict,
+    so callers may modify the result freely.
+    """
+    try:
+        cached = _json_schema_cache.get(schema_cls)
+    except TypeError:
+        # Not weak-referenceable (e.g. a schema instance rather than a class)
+        return schema_cls.model_json_schema()
+    if cached is None:
+        cached = _json_schema_cache[schema_cls] = schema_cls.model_json_schema()
+    return clone_json(cached)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Annotated, Any, Literal, Union
 
@@ -13,6 +17,7 @@ from pydantic.functional_validators import AfterValidator
 
 from apcore.config import Config
 from apcore.errors import SchemaNotFoundError, SchemaParseError
+from apcore.schema.json_schema import cached_model_json_schema
 from apcore.schema.ref_resolver import RefResolver
 from apcore.schema.types import ResolvedSchema, SchemaDefinition, SchemaStrategy
 
@@ -28,6 +33,38 @@ _TYPE_MAP: dict[str, type] = {
     "null": type(None),
 }
 
+# Keywords _schema_to_field_info handles (or rejects) before looking at "type"
+_KEYWORD_BRANCHES = frozenset({"not", "if", "const", "enum", "oneOf", "anyOf", "allOf"})
+
+# JSON Schema keywords that map directly onto pydantic Field kwargs
+_FIELD_KWARGS: dict[str, str] = {
+    "default": "default",
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "multipleOf": "multiple_of",
+    "pattern": "pattern",
+}
+# Length limits: string keywords, or the array ones when building an array field
+_STRING_LENGTH_KWARGS: dict[str, str] = {"minLength": "min_length", "maxLength": "max_length"}
+_ARRAY_LENGTH_KWARGS: dict[str, str] = {"minItems": "min_length", "maxItems": "max_length"}
+
+# Schema files go through libyaml's safe parser when PyYAML ships it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bumped whenever the layout of on-disk schema cache entries changes
+_DISK_CACHE_VERSION = b"2"
+
+
+def _schema_digest(json_schema: dict[str, Any]) -> bytes | None:
+    """Digest of a schema's canonical JSON form, or None if it has no canonical form."""
+    try:
+        canonical = json.dumps(json_schema, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        return None  # e.g. mixed-type keys, which sort_keys cannot order
+    return hashlib.blake2b(canonical.encode()).digest()
+
 
 def _check_unique(v: list[Any]) -> list[Any]:
     if len(v) != len(set(v)):
@@ -48,18 +85,38 @@ class SchemaLoader:
         self._resolver = RefResolver(self._schemas_dir, max_depth=max_depth)
         self._schema_cache: dict[str, SchemaDefinition] = {}
         self._model_cache: dict[str, tuple[ResolvedSchema, ResolvedSchema]] = {}
+        self._schema_paths: dict[str, Path] = {}
+        # Generated models by (model name, schema digest); nested models are
+        # named after their parent, so no model is shared between modules
+        self._generated_models: dict[tuple[str, bytes], type[BaseModel]] = {}
+        cache_dir = config.get("schema.cache_dir")
+        self._cache_dir: Path | None = Path(cache_dir) if cache_dir else None
 
     def load(self, module_id: str) -> SchemaDefinition:
         """Load a schema definition from a YAML file."""
         if module_id in self._schema_cache:
             return self._schema_cache[module_id]
 
-        file_path = self._schemas_dir / (module_id.replace(".", "/") + ".schema.yaml")
-        if not file_path.exists():
-            raise SchemaNotFoundError(schema_id=module_id)
+        sd = self._parse_definition(module_id, self._read_schema_file(module_id))
+        self._schema_cache[module_id] = sd
+        return sd
+
+    def _read_schema_file(self, module_id: str) -> bytes:
+        """Read the raw bytes of a module's schema file."""
+        file_path = self._schema_paths.get(module_id)
+        if file_path is None:
+            file_path = self._schemas_dir / (module_id.replace(".", "/") + ".schema.yaml")
+            self._schema_paths[module_id] = file_path
+        # The read doubles as the existence check
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
+            raise SchemaNotFoundError(schema_id=module_id) from None
 
+    def _parse_definition(self, module_id: str, content: bytes) -> SchemaDefinition:
+        """Parse and validate the contents of a schema file."""
         try:
-            data = yaml.safe_load(file_path.read_text())
+            data = yaml.load(content, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise SchemaParseError(message=f"Invalid YAML in schema for '{module_id}': {e}") from e
 
@@ -77,7 +134,7 @@ class SchemaLoader:
         if len(description) > 200:
             logger.warning(f"Schema description for '{module_id}' exceeds 200 characters")
 
-        sd = SchemaDefinition(
+        return SchemaDefinition(
             module_id=data.get("module_id", module_id),
             description=description,
             input_schema=data["input_schema"],
@@ -88,8 +145,6 @@ class SchemaLoader:
             documentation=data.get("documentation"),
             schema_url=data.get("$schema"),
         )
-        self._schema_cache[module_id] = sd
-        return sd
 
     def resolve(self, schema_def: SchemaDefinition) -> tuple[ResolvedSchema, ResolvedSchema]:
         """Resolve all $ref references in a SchemaDefinition."""
@@ -97,26 +152,50 @@ class SchemaLoader:
         # not against the whole YAML file. Cross-file refs use schemas_dir as base.
         resolved_input = self._resolver.resolve(schema_def.input_schema)
         resolved_output = self._resolver.resolve(schema_def.output_schema)
+        return self._build_resolved(schema_def.module_id, resolved_input, resolved_output)
 
-        input_model = self.generate_model(resolved_input, f"{schema_def.module_id}_Input")
-        output_model = self.generate_model(resolved_output, f"{schema_def.module_id}_Output")
+    def _build_resolved(
+        self,
+        module_id: str,
+        resolved_input: dict[str, Any],
+        resolved_output: dict[str, Any],
+    ) -> tuple[ResolvedSchema, ResolvedSchema]:
+        """Generate models for already-resolved input/output schemas."""
+        input_model = self.generate_model(resolved_input, f"{module_id}_Input")
+        output_model = self.generate_model(resolved_output, f"{module_id}_Output")
 
         input_rs = ResolvedSchema(
             json_schema=resolved_input,
             model=input_model,
-            module_id=schema_def.module_id,
+            module_id=module_id,
             direction="input",
         )
         output_rs = ResolvedSchema(
             json_schema=resolved_output,
             model=output_model,
-            module_id=schema_def.module_id,
+            module_id=module_id,
             direction="output",
         )
         return input_rs, output_rs
 
     def generate_model(self, json_schema: dict[str, Any], model_name: str) -> type[BaseModel]:
-        """Dynamically generate a Pydantic BaseModel from a JSON Schema dict."""
+        """Dynamically generate a Pydantic BaseModel from a JSON Schema dict.
+
+        Models, including nested ones, are memoized by name and schema
+        content, so regenerating an unchanged schema returns the same class.
+        """
+        digest = _schema_digest(json_schema)
+        if digest is None:
+            return self._build_model(json_schema, model_name)
+        key = (model_name, digest)
+        model = self._generated_models.get(key)
+        if model is None:
+            model = self._build_model(json_schema, model_name)
+            self._generated_models[key] = model
+        return model
+
+    def _build_model(self, json_schema: dict[str, Any], model_name: str) -> type[BaseModel]:
+        """Create the Pydantic model for ``generate_model``."""
         properties = json_schema.get("properties", {})
         required = set(json_schema.get("required", []))
 
@@ -142,39 +221,42 @@ class SchemaLoader:
         if not prop_schema:
             return dict[str, Any], Field(default=...)
 
-        # Unsupported keywords
-        if "not" in prop_schema:
-            raise SchemaParseError(message="'not' keyword not yet supported")
-        if "if" in prop_schema:
-            raise SchemaParseError(message="if/then/else not yet supported")
-
-        # const
-        if "const" in prop_schema:
-            val = prop_schema["const"]
-            return Literal[val], Field(default=...)  # type: ignore[valid-type]
-
-        # enum
-        if "enum" in prop_schema:
-            values = tuple(prop_schema["enum"])
-            return Literal[values], Field(default=...)  # type: ignore[valid-type]
-
-        # Composition
-        if "oneOf" in prop_schema:
-            types = [
-                self._schema_to_type(s, f"{prop_name}_oneOf_{i}", parent_name)
-                for i, s in enumerate(prop_schema["oneOf"])
-            ]
-            return Union[tuple(types)], Field(default=...)  # type: ignore[valid-type]
-
-        if "anyOf" in prop_schema:
-            types = [
-                self._schema_to_type(s, f"{prop_name}_anyOf_{i}", parent_name)
-                for i, s in enumerate(prop_schema["anyOf"])
-            ]
-            return Union[tuple(types)], Field(default=...)  # type: ignore[valid-type]
-
-        if "allOf" in prop_schema:
-            return self._handle_all_of(prop_schema["allOf"], prop_name, parent_name), Field(default=...)
+        # Most properties use none of these keywords; one pass over the
+        # property's keys rules them all out before the type dispatch
+        if not _KEYWORD_BRANCHES.isdisjoint(prop_schema):
+            # Unsupported keywords
+            if "not" in prop_schema:
+                raise SchemaParseError(message="'not' keyword not yet supported")
+            if "if" in prop_schema:
+                raise SchemaParseError(message="if/then/else not yet supported")
+
+            # const
+            if "const" in prop_schema:
+                val = prop_schema["const"]
+                return Literal[val], Field(default=...)  # type: ignore[valid-type]
+
+            # enum
+            if "enum" in prop_schema:
+                values = tuple(prop_schema["enum"])
+                return Literal[values], Field(default=...)  # type: ignore[valid-type]
+
+            # Composition
+            if "oneOf" in prop_schema:
+                types = [
+                    self._schema_to_type(s, f"{prop_name}_oneOf_{i}", parent_name)
+                    for i, s in enumerate(prop_schema["oneOf"])
+                ]
+                return Union[tuple(types)], Field(default=...)  # type: ignore[valid-type]
+
+            if "anyOf" in prop_schema:
+                types = [
+                    self._schema_to_type(s, f"{prop_name}_anyOf_{i}", parent_name)
+                    for i, s in enumerate(prop_schema["anyOf"])
+                ]
+                return Union[tuple(types)], Field(default=...)  # type: ignore[valid-type]
+
+            if "allOf" in prop_schema:
+                return self._handle_all_of(prop_schema["allOf"], prop_name, parent_name), Field(default=...)
 
         # Type-based dispatch
         schema_type = prop_schema.get("type")
@@ -268,41 +350,16 @@ class SchemaLoader:
     def _build_field(self, prop_schema: dict[str, Any], is_array: bool = False) -> Any:
         """Build a Pydantic Field from JSON Schema constraints."""
         kwargs: dict[str, Any] = {"default": ...}
+        length_kwargs = _ARRAY_LENGTH_KWARGS if is_array else _STRING_LENGTH_KWARGS
 
-        if "default" in prop_schema:
-            kwargs["default"] = prop_schema["default"]
-
-        # Numeric constraints
-        if "minimum" in prop_schema:
-            kwargs["ge"] = prop_schema["minimum"]
-        if "maximum" in prop_schema:
-            kwargs["le"] = prop_schema["maximum"]
-        if "exclusiveMinimum" in prop_schema:
-            kwargs["gt"] = prop_schema["exclusiveMinimum"]
-        if "exclusiveMaximum" in prop_schema:
-            kwargs["lt"] = prop_schema["exclusiveMaximum"]
-        if "multipleOf" in prop_schema:
-            kwargs["multiple_of"] = prop_schema["multipleOf"]
-
-        # String constraints
-        if not is_array:
-            if "minLength" in prop_schema:
-                kwargs["min_length"] = prop_schema["minLength"]
-            if "maxLength" in prop_schema:
-                kwargs["max_length"] = prop_schema["maxLength"]
-        else:
-            if "minItems" in prop_schema:
-                kwargs["min_length"] = prop_schema["minItems"]
-            if "maxItems" in prop_schema:
-                kwargs["max_length"] = prop_schema["maxItems"]
-
-        if "pattern" in prop_schema:
-            kwargs["pattern"] = prop_schema["pattern"]
-
-        # LLM extensions and format as json_schema_extra
+        # One pass over the schema's keys: constraints map to Field kwargs and
+        # LLM extensions go to json_schema_extra
         extra: dict[str, Any] = {}
         for key, value in prop_schema.items():
-            if key.startswith("x-"):
+            kwarg = _FIELD_KWARGS.get(key) or length_kwargs.get(key)
+            if kwarg is not None:
+                kwargs[kwarg] = value
+            elif key.startswith("x-"):
                 extra[key] = value
         if "format" in prop_schema:
             extra["format"] = prop_schema["format"]
@@ -358,11 +415,101 @@ class SchemaLoader:
         """Load and resolve a schema, using model cache."""
         if module_id in self._model_cache:
             return self._model_cache[module_id]
-        sd = self.load(module_id)
-        result = self.resolve(sd)
+        if self._cache_dir is None:
+            result = self.resolve(self.load(module_id))
+        else:
+            result = self._load_and_resolve_cached(module_id, self._cache_dir)
         self._model_cache[module_id] = result
         return result
 
+    def _load_and_resolve_cached(self, module_id: str, cache_dir: Path) -> tuple[ResolvedSchema, ResolvedSchema]:
+        """Load and resolve a schema through the on-disk cache in ``schema.cache_dir``.
+
+        Entries are JSON files holding the resolved input/output JSON Schemas
+        (models are regenerated from them), keyed by a digest of the module ID, schemas
+        directory and schema file contents. Each entry also records digests of the
+        files its $refs pulled in, and is ignored if any of them changed.
+        """
+        content = self._read_schema_file(module_id)
+        key = hashlib.blake2b(
+            b"\0".join((_DISK_CACHE_VERSION, module_id.encode(), str(self._schemas_dir).encode(), content))
+        ).hexdigest()
+        entry_path = cache_dir / f"{key}.json"
+
+        entry = self._read_cache_entry(entry_path)
+        if entry is not None:
+            def_module_id, resolved_input, resolved_output, _ = entry
+            return self._build_resolved(def_module_id, resolved_input, resolved_output)
+
+        sd = self._parse_definition(module_id, content)
+        self._schema_cache[module_id] = sd
+        resolved_input = self._resolver.resolve(sd.input_schema)
+        ref_digests = {str(path): digest for path, digest in self._resolver.loaded_file_digests().items()}
+        resolved_output = self._resolver.resolve(sd.output_schema)
+        ref_digests.update((str(path), digest) for path, digest in self._resolver.loaded_file_digests().items())
+        self._write_cache_entry(
+            entry_path,
+            {
+                "module_id": sd.module_id,
+                "input_schema": resolved_input,
+                "output_schema": resolved_output,
+                "ref_digests": ref_digests,
+            },
+        )
+        return self._build_resolved(sd.module_id, resolved_input, resolved_output)
+
+    def _read_cache_entry(self, entry_path: Path) -> tuple[str, dict[str, Any], dict[str, Any], dict[str, str]] | None:
+        """Return a cache entry if it exists, has the expected shape and its referenced files are unchanged."""
+        try:
+            with entry_path.open("rb") as f:
+                entry = json.load(f)
+            module_id = entry["module_id"]
+            resolved_input = entry["input_schema"]
+            resolved_output = entry["output_schema"]
+            ref_digests = entry["ref_digests"]
+            if not (
+                isinstance(module_id, str)
+                and isinstance(resolved_input, dict)
+                and isinstance(resolved_output, dict)
+                and isinstance(ref_digests, dict)
+                and all(isinstance(digest, str) for digest in ref_digests.values())
+            ):
+                return None
+            for ref_path, digest in ref_digests.items():
+                if hashlib.blake2b(Path(ref_path).read_bytes()).hexdigest() != digest:
+                    return None
+        except FileNotFoundError:
+            return None
+        # A truncated, outdated or foreign file can fail to decode or unpack in any of these ways
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug("Ignoring unreadable schema cache entry %s: %s", entry_path, e)
+            return None
+        return module_id, resolved_input, resolved_output, ref_digests
+
+    def _write_cache_entry(self, entry_path: Path, entry: dict[str, Any]) -> None:
+        """Atomically write a cache entry; failures only cost the next load a miss."""
+        try:
+            text = json.dumps(entry, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug("Schema cache entry %s is not JSON serializable: %s", entry_path, e)
+            return
+        # YAML allows values JSON cannot round-trip (e.g. integer keys); such entries are not cached
+        if json.loads(text) != entry:
+            logger.debug("Schema cache entry %s does not round-trip through JSON; not caching", entry_path)
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_name, entry_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug("Could not write schema cache entry %s: %s", entry_path, e)
+
     def _wrap_native(
         self,
         module_id: str,
@@ -371,13 +518,13 @@ class SchemaLoader:
     ) -> tuple[ResolvedSchema, ResolvedSchema]:
         """Wrap native Pydantic models as ResolvedSchema without re-generating."""
         input_rs = ResolvedSchema(
-            json_schema=input_model.model_json_schema(),
+            json_schema=cached_model_json_schema(input_model),
             model=input_model,
             module_id=module_id,
             direction="input",
         )
         output_rs = ResolvedSchema(
-            json_schema=output_model.model_json_schema(),
+            json_schema=cached_model_json_schema(output_model),
             model=output_model,
             module_id=module_id,
             direction="output",
@@ -385,7 +532,8 @@ class SchemaLoader:
         return input_rs, output_rs
 
     def clear_cache(self) -> None:
-        """Clear all internal caches."""
+        """Clear all internal caches. Entries in ``schema.cache_dir`` are kept."""
         self._schema_cache.clear()
         self._model_cache.clear()
+        self._generated_models.clear()
         self._resolver.clear_cache()
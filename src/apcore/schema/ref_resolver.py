@@ -2,18 +2,94 @@
 
 from __future__ import annotations
 
-import copy
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from apcore.errors import SchemaCircularRefError, SchemaNotFoundError, SchemaParseError
+from apcore.utils.clone import clone_json
 
 __all__ = ["RefResolver"]
 
 _INLINE_SENTINEL = Path("__inline__")
 
+# Referenced files are parsed with the C SafeLoader if available (pure Python otherwise)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Upper bound on threads used to prefetch referenced files
+_PREFETCH_WORKERS = 8
+
+
+def _parse_content(file_path: Path, content: bytes) -> dict[str, Any]:
+    """Parse the bytes of one schema file; empty documents parse to ``{}``."""
+    if not content.strip():
+        return {}
+
+    try:
+        parsed = yaml.load(content, Loader=_YAML_LOADER)
+    except yaml.YAMLError as e:
+        raise SchemaParseError(message=f"Invalid YAML in {file_path}: {e}") from e
+
+    if parsed is None:
+        return {}
+
+    if not isinstance(parsed, dict):
+        raise SchemaParseError(message=f"Schema file {file_path} must be a YAML mapping, got {type(parsed).__name__}")
+    return parsed
+
+
+def _fetch_file(
+    file_path: Path, known_stamp: tuple[int, int] | None
+) -> tuple[Path, tuple[int, int], str | None, dict[str, Any] | None] | None:
+    """Stat, read and parse a file for prefetching, touching no resolver state.
+
+    Returns ``(resolved path, stamp, digest, document)``; digest and document
+    are None when the stamp equals ``known_stamp``. Returns None if the file
+    cannot be loaded, leaving the error for resolution to raise.
+    """
+    try:
+        file_path = file_path.resolve()
+        st = file_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == known_stamp:
+            return file_path, stamp, None, None
+        content = file_path.read_bytes()
+        return file_path, stamp, hashlib.blake2b(content).hexdigest(), _parse_content(file_path, content)
+    except (SchemaParseError, OSError):
+        return None
+
+
+def _has_ref(node: Any) -> bool:
+    """Return True if any dict in the tree has a ``$ref`` key."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if "$ref" in current:
+                return True
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return False
+
+
+def _iter_refs(node: Any) -> list[Any]:
+    """Collect the value of every ``$ref`` key in the tree."""
+    refs: list[Any] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if "$ref" in current:
+                refs.append(current["$ref"])
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return refs
+
 
 class RefResolver:
     """Resolves $ref references in JSON Schema documents.
@@ -27,6 +103,18 @@ class RefResolver:
         self._schemas_dir: Path = Path(schemas_dir).resolve()
         self._max_depth: int = max_depth
         self._file_cache: dict[Path, dict[str, Any]] = {}
+        # (mtime_ns, size) of each cached file when parsed, and the files already
+        # checked against it during the current resolve()
+        self._file_stamps: dict[Path, tuple[int, int]] = {}
+        self._checked_files: set[Path] = set()
+        # Content digest of each parsed file, and every file the last resolve()
+        # touched; see loaded_file_digests()
+        self._file_digests: dict[Path, str] = {}
+        self._loaded_files: set[Path] = set()
+        self._canonical_paths: dict[str, Path] = {}
+        self._parsed_refs: dict[tuple[str, Path | None], tuple[Path, str]] = {}
+        # Built on the first prefetch wave with more than one file, then reused
+        self._prefetch_pool: ThreadPoolExecutor | None = None
 
     def resolve(self, schema: dict[str, Any], current_file: Path | None = None) -> dict[str, Any]:
         """Resolve all $ref references in a schema dictionary.
@@ -34,14 +122,28 @@ class RefResolver:
         Returns a new dict with all $ref nodes replaced by their resolved content.
         The original schema is never modified.
         """
-        result = copy.deepcopy(schema)
+        result = clone_json(schema)
+        self._loaded_files.clear()
+        if not _has_ref(result):
+            return result
+        self._checked_files.clear()
+        self._prefetch_refs(result, current_file)
         # Cache the inline schema so local $ref (#/...) can resolve against it
         self._file_cache[_INLINE_SENTINEL] = result
         try:
-            self._resolve_node(result, current_file, visited_refs=set(), depth=0)
+            resolved = self._resolve_node(result, current_file, visited_refs=set(), depth=0)
         finally:
             self._file_cache.pop(_INLINE_SENTINEL, None)
-        return result
+        # A root $ref to a non-object target has always resolved to an empty schema
+        return resolved if isinstance(resolved, dict) else {}
+
+    def loaded_file_digests(self) -> dict[Path, str]:
+        """Return the content digest of every file the last ``resolve()`` read.
+
+        Files served from the cache count as read. Callers that cache resolved
+        schemas can compare these digests to tell whether a result is stale.
+        """
+        return {path: self._file_digests[path] for path in self._loaded_files}
 
     def resolve_ref(
         self,
@@ -63,66 +165,151 @@ class RefResolver:
                 ref_path=f"Maximum reference depth {self._max_depth} exceeded resolving: {ref_string}"
             )
 
+        # visited_refs holds the refs on the current resolution path: added on
+        # entry and removed on exit, so sibling branches may reuse a ref
         visited_refs.add(ref_string)
+        try:
+            file_path, json_pointer = self._parse_ref(ref_string, current_file)
+            document = self._load_file(file_path)
+            target = self._resolve_json_pointer(document, json_pointer, ref_string)
+
+            result = clone_json(target)
+
+            if sibling_keys and isinstance(result, dict):
+                result.update(sibling_keys)
+
+            # Determine the effective file for nested resolution
+            effective_file = current_file if file_path == _INLINE_SENTINEL else file_path
+
+            if isinstance(result, dict) and "$ref" in result:
+                nested_ref = result.pop("$ref")
+                nested_siblings = {k: v for k, v in result.items()} if result else None
+                result = self.resolve_ref(
+                    nested_ref,
+                    effective_file,
+                    visited_refs,
+                    depth + 1,
+                    nested_siblings if nested_siblings else None,
+                )
 
-        file_path, json_pointer = self._parse_ref(ref_string, current_file)
-        document = self._load_file(file_path)
-        target = self._resolve_json_pointer(document, json_pointer, ref_string)
-
-        result = copy.deepcopy(target)
-
-        if sibling_keys and isinstance(result, dict):
-            result.update(sibling_keys)
-
-        # Determine the effective file for nested resolution
-        effective_file = current_file if file_path == _INLINE_SENTINEL else file_path
+            return self._resolve_node(result, effective_file, visited_refs, depth + 1)
+        finally:
+            visited_refs.discard(ref_string)
 
-        if isinstance(result, dict) and "$ref" in result:
-            nested_ref = result.pop("$ref")
-            nested_siblings = {k: v for k, v in result.items()} if result else None
-            result = self.resolve_ref(
-                nested_ref,
-                effective_file,
-                visited_refs,
-                depth + 1,
-                nested_siblings if nested_siblings else None,
-            )
+    def _prefetch_refs(self, schema: dict[str, Any], current_file: Path | None) -> None:
+        """Load the files reachable through ``schema``'s $refs into the file cache.
 
-        self._resolve_node(result, effective_file, visited_refs, depth + 1)
-        return result
+        Files are discovered breadth-first (each loaded document is scanned for
+        further refs). Every wave of files not yet checked in this resolve is
+        stat'ed, read and parsed by ``_fetch_file`` on the resolver's thread
+        pool; only this thread stores the results. Load errors are ignored here;
+        resolution hits the same file again and raises them at the usual point.
+        """
+        seen: set[Path] = set()
+        pending: list[tuple[Any, Path | None]] = [(schema, current_file)]
+        while pending:
+            to_load: list[Path] = []
+            for node, base in pending:
+                for ref in _iter_refs(node):
+                    if not isinstance(ref, str):
+                        continue
+                    file_path = self._parse_ref(ref, base)[0]
+                    if file_path == _INLINE_SENTINEL or file_path in seen:
+                        continue
+                    seen.add(file_path)
+                    if file_path not in self._checked_files:
+                        to_load.append(file_path)
+            if not to_load:
+                break
+            stamps = [self._file_stamps.get(path) for path in to_load]
+            if len(to_load) == 1:
+                fetched = [_fetch_file(to_load[0], stamps[0])]
+            else:
+                if self._prefetch_pool is None:
+                    self._prefetch_pool = ThreadPoolExecutor(
+                        max_workers=_PREFETCH_WORKERS, thread_name_prefix="apcore-ref-prefetch"
+                    )
+                fetched = list(self._prefetch_pool.map(_fetch_file, to_load, stamps))
+            pending = []
+            for result in fetched:
+                if result is None:
+                    continue
+                document = self._store_fetched(result)
+                if document:
+                    pending.append((document, result[0]))
+
+    def _store_fetched(
+        self, result: tuple[Path, tuple[int, int], str | None, dict[str, Any] | None]
+    ) -> dict[str, Any] | None:
+        """Record a ``_fetch_file`` result in the caches and return the file's document."""
+        file_path, stamp, digest, document = result
+        if digest is None or document is None:
+            # Unchanged on disk; the cached parse is still current
+            if self._file_stamps.get(file_path) != stamp:
+                return None
+            self._checked_files.add(file_path)
+            return self._file_cache.get(file_path)
+        self._file_cache[file_path] = document
+        self._file_stamps[file_path] = stamp
+        self._file_digests[file_path] = digest
+        self._checked_files.add(file_path)
+        return document
 
     def _resolve_node(self, node: Any, current_file: Path | None, visited_refs: set[str], depth: int) -> Any:
-        """Recursively walk a node, resolving any $ref found. Modifies in-place."""
-        if isinstance(node, dict):
-            if "$ref" in node:
-                ref_string = node["$ref"]
-                sibling_keys = {k: v for k, v in node.items() if k != "$ref"}
-                resolved = self.resolve_ref(
-                    ref_string,
-                    current_file,
-                    visited_refs.copy(),
-                    depth,
-                    sibling_keys or None,
-                )
-                node.clear()
-                if isinstance(resolved, dict):
-                    node.update(resolved)
-                else:
-                    return resolved
+        """Walk a node, resolving any $ref found. Modifies in-place.
+
+        $ref nodes are replaced in their parent container; the return value is
+        ``node``, or its resolved replacement when ``node`` is itself a $ref. Nested containers are walked with an explicit
+        stack; only following a $ref recurses (through ``resolve_ref``).
+        """
+        if isinstance(node, dict) and "$ref" in node:
+            return self._resolve_ref_node(node, current_file, visited_refs, depth)
+
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                items: Any = current.items()
+            elif isinstance(current, list):
+                items = enumerate(current)
             else:
-                for key in list(node.keys()):
-                    result = self._resolve_node(node[key], current_file, visited_refs, depth)
-                    if result is not node[key]:
-                        node[key] = result
-        elif isinstance(node, list):
-            for i, item in enumerate(node):
-                result = self._resolve_node(item, current_file, visited_refs, depth)
-                if result is not item:
-                    node[i] = result
+                continue
+            # Reassigning an existing key/index is safe while iterating
+            for key, value in items:
+                if isinstance(value, dict):
+                    if "$ref" in value:
+                        # One slot assignment installs the resolved subtree
+                        current[key] = self._resolve_ref_node(value, current_file, visited_refs, depth)
+                    else:
+                        stack.append(value)
+                elif isinstance(value, list):
+                    stack.append(value)
         return node
 
+    def _resolve_ref_node(
+        self, node: dict[str, Any], current_file: Path | None, visited_refs: set[str], depth: int
+    ) -> Any:
+        """Return the resolved replacement for a ``{"$ref": ...}`` node; ``node`` is left as is."""
+        sibling_keys = {k: v for k, v in node.items() if k != "$ref"}
+        return self.resolve_ref(
+            node["$ref"],
+            current_file,
+            visited_refs,
+            depth,
+            sibling_keys or None,
+        )
+
     def _parse_ref(self, ref_string: str, current_file: Path | None) -> tuple[Path, str]:
-        """Parse a $ref string into (file_path, json_pointer)."""
+        """Parse a $ref string into (file_path, json_pointer), memoized per referring file."""
+        key = (ref_string, current_file)
+        parsed = self._parsed_refs.get(key)
+        if parsed is None:
+            parsed = self._split_ref(ref_string, current_file)
+            self._parsed_refs[key] = parsed
+        return parsed
+
+    def _split_ref(self, ref_string: str, current_file: Path | None) -> tuple[Path, str]:
+        """Uncached ``_parse_ref``; relative file refs are resolved against the filesystem."""
         if ref_string.startswith("#"):
             pointer = ref_string[1:]
             if current_file:
@@ -147,11 +334,15 @@ class RefResolver:
         canonical_id = parts[0]
         pointer_parts = parts[1:]
 
-        file_rel = canonical_id.replace(".", "/") + ".schema.yaml"
-        file_path = self._schemas_dir / file_rel
+        # Path.resolve() stats each path component, so resolve each ID once
+        file_path = self._canonical_paths.get(canonical_id)
+        if file_path is None:
+            file_rel = canonical_id.replace(".", "/") + ".schema.yaml"
+            file_path = (self._schemas_dir / file_rel).resolve()
+            self._canonical_paths[canonical_id] = file_path
 
         pointer = "/" + "/".join(pointer_parts) if pointer_parts else ""
-        return file_path.resolve(), pointer
+        return file_path, pointer
 
     def _resolve_json_pointer(self, document: Any, pointer: str, ref_string: str) -> Any:
         """Navigate a document using an RFC 6901 JSON Pointer."""
@@ -164,7 +355,8 @@ class RefResolver:
 
         current = document
         for segment in segments:
-            segment = segment.replace("~1", "/").replace("~0", "~")
+            if "~" in segment:  # most segments have no escapes to decode
+                segment = segment.replace("~1", "/").replace("~0", "~")
             if isinstance(current, dict) and segment in current:
                 current = current[segment]
             else:
@@ -172,39 +364,50 @@ class RefResolver:
         return current
 
     def _load_file(self, file_path: Path) -> dict[str, Any]:
-        """Load and parse a YAML or JSON file, using cache when available."""
+        """Load and parse a YAML or JSON file, using cache when available.
+
+        A cached file is re-parsed when its mtime or size has changed. Each
+        file is stat'ed at most once per ``resolve()`` call.
+        """
         if file_path == _INLINE_SENTINEL:
             return self._file_cache.get(_INLINE_SENTINEL, {})
 
         file_path = file_path.resolve()
-        if file_path in self._file_cache:
-            return self._file_cache[file_path]
-
-        if not file_path.exists():
-            raise SchemaNotFoundError(schema_id=str(file_path))
-
-        content = file_path.read_text()
-        if not content.strip():
-            self._file_cache[file_path] = {}
-            return {}
+        self._loaded_files.add(file_path)
+        cached = self._file_cache.get(file_path)
+        if cached is not None and file_path in self._checked_files:
+            return cached
 
         try:
-            parsed = yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            raise SchemaParseError(message=f"Invalid YAML in {file_path}: {e}") from e
-
-        if parsed is None:
-            self._file_cache[file_path] = {}
-            return {}
-
-        if not isinstance(parsed, dict):
-            raise SchemaParseError(
-                message=f"Schema file {file_path} must be a YAML mapping, got {type(parsed).__name__}"
-            )
-
+            st = file_path.stat()
+        except FileNotFoundError:
+            raise SchemaNotFoundError(schema_id=str(file_path)) from None
+        stamp = (st.st_mtime_ns, st.st_size)
+        if cached is not None and self._file_stamps.get(file_path) == stamp:
+            self._checked_files.add(file_path)
+            return cached
+
+        parsed = self._parse_file(file_path)
         self._file_cache[file_path] = parsed
+        self._file_stamps[file_path] = stamp
+        self._checked_files.add(file_path)
         return parsed
 
+    def _parse_file(self, file_path: Path) -> dict[str, Any]:
+        """Read and parse one schema file; empty documents parse to ``{}``."""
+        try:
+            content = file_path.read_bytes()
+        except FileNotFoundError:
+            raise SchemaNotFoundError(schema_id=str(file_path)) from None
+        self._file_digests[file_path] = hashlib.blake2b(content).hexdigest()
+        return _parse_content(file_path, content)
+
     def clear_cache(self) -> None:
         """Clear the file cache."""
         self._file_cache.clear()
+        self._file_stamps.clear()
+        self._checked_files.clear()
+        self._file_digests.clear()
+        self._loaded_files.clear()
+        self._canonical_paths.clear()
+        self._parsed_refs.clear()
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any
 
+from apcore.utils.clone import clone_json
+
+# How _make_strict reached a dict: a schema (stripped and made strict), a map
+# of name -> schema such as ``properties``, or any other dict (only stripped)
+_SCHEMA, _SCHEMA_MAP, _PLAIN = 0, 1, 2
+_SCHEMA_MAP_KEYWORDS = frozenset({"properties", "definitions", "$defs"})
+_SCHEMA_LIST_KEYWORDS = frozenset({"oneOf", "anyOf", "allOf"})
+
 
 def to_strict_schema(schema: dict[str, Any]) -> dict[str, Any]:
     """Convert a JSON Schema to OpenAI/Anthropic Strict Mode format.
@@ -13,17 +20,72 @@ def to_strict_schema(schema: dict[str, Any]) -> dict[str, Any]:
     strict mode rules (additionalProperties: false, all properties required,
     optional fields become nullable).
     """
-    result = copy.deepcopy(schema)
-    _strip_extensions(result)
-    _convert_to_strict(result)
+    result = clone_json(schema)
+    _make_strict(result)
     return result
 
 
+def _make_strict(schema: dict[str, Any]) -> None:
+    """Strip extensions and enforce strict mode rules. Mutates in place.
+
+    For callers that already own a private copy of the schema, so
+    ``to_strict_schema``'s deep copy would be redundant.
+
+    Both steps share one walk. Each entry on the stack carries how the
+    node was reached: only schemas reached through ``properties``, ``items``,
+    ``oneOf``/``anyOf``/``allOf`` and ``definitions``/``$defs`` get the strict
+    rules, as every other dict is only stripped.
+    """
+    stack: list[tuple[dict[Any, Any], int]] = [(schema, _SCHEMA)]
+    while stack:
+        node, role = stack.pop()
+        _strip_keys(node)
+        if role == _SCHEMA:
+            properties = node.get("properties")
+            if isinstance(properties, dict):
+                # Stripped before required is computed from its keys
+                _strip_keys(properties)
+            _enforce_strict_rules(node)
+
+        for key, value in node.items():
+            if isinstance(value, dict):
+                if role == _SCHEMA and key in _SCHEMA_MAP_KEYWORDS:
+                    stack.append((value, _SCHEMA_MAP))
+                elif (role == _SCHEMA and key == "items") or role == _SCHEMA_MAP:
+                    stack.append((value, _SCHEMA))
+                else:
+                    stack.append((value, _PLAIN))
+            elif isinstance(value, list):
+                item_role = _SCHEMA if role == _SCHEMA and key in _SCHEMA_LIST_KEYWORDS else _PLAIN
+                stack.extend((item, item_role) for item in value if isinstance(item, dict))
+
+
 def _apply_llm_descriptions(node: Any) -> None:
     """Replace description with x-llm-description where present.
 
     Mutates the node in place. Called by exporters before to_strict_schema().
     """
+    # Most schemas carry no x-llm-description; one stack scan rules that out cheaply
+    if _has_llm_description(node):
+        _replace_llm_descriptions(node)
+
+
+def _has_llm_description(node: Any) -> bool:
+    """Return True if any dict in the tree has an ``x-llm-description`` key."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if "x-llm-description" in current:
+                return True
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return False
+
+
+def _replace_llm_descriptions(node: Any) -> None:
+    """Recursive worker for ``_apply_llm_descriptions``."""
     if not isinstance(node, dict):
         return
 
@@ -33,17 +95,17 @@ def _apply_llm_descriptions(node: Any) -> None:
     # Recurse into nested structures
     if "properties" in node and isinstance(node["properties"], dict):
         for prop in node["properties"].values():
-            _apply_llm_descriptions(prop)
+            _replace_llm_descriptions(prop)
     if "items" in node and isinstance(node["items"], dict):
-        _apply_llm_descriptions(node["items"])
+        _replace_llm_descriptions(node["items"])
     for keyword in ("oneOf", "anyOf", "allOf"):
         if keyword in node and isinstance(node[keyword], list):
             for sub in node[keyword]:
-                _apply_llm_descriptions(sub)
+                _replace_llm_descriptions(sub)
     for defs_key in ("definitions", "$defs"):
         if defs_key in node and isinstance(node[defs_key], dict):
             for defn in node[defs_key].values():
-                _apply_llm_descriptions(defn)
+                _replace_llm_descriptions(defn)
 
 
 def _strip_extensions(node: Any) -> None:
@@ -51,32 +113,64 @@ def _strip_extensions(node: Any) -> None:
     if not isinstance(node, dict):
         return
 
-    keys_to_remove = [k for k in node if (isinstance(k, str) and k.startswith("x-")) or k == "default"]
-    for k in keys_to_remove:
-        del node[k]
-
-    for value in node.values():
-        if isinstance(value, dict):
-            _strip_extensions(value)
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    _strip_extensions(item)
+    # Explicit stack instead of recursion: no call frame per nested schema node
+    stack: list[dict[Any, Any]] = [node]
+    while stack:
+        current = stack.pop()
+        _strip_keys(current)
+
+        for value in current.values():
+            if isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, dict))
+
+
+def _strip_keys(node: dict[Any, Any]) -> None:
+    """Remove the x-* and default keys of a single dict."""
+    keys_to_remove = None  # only allocated when something matches
+    for k in node:
+        if k == "default" or (isinstance(k, str) and k[:2] == "x-"):
+            if keys_to_remove is None:
+                keys_to_remove = [k]
+            else:
+                keys_to_remove.append(k)
+    if keys_to_remove is not None:
+        for k in keys_to_remove:
+            del node[k]
 
 
-def _convert_to_strict(node: Any) -> None:
-    """Enforce strict mode rules on an object schema. Mutates in place."""
-    if not isinstance(node, dict):
-        return
+def _copy_without_extensions(node: Any) -> Any:
+    """Deep-copy a schema node with x-* and default keys left out.
 
+    Produces the same result as deep-copying and then calling
+    ``_strip_extensions``, in a single traversal.
+    """
+    if isinstance(node, dict):
+        return {
+            k: _copy_without_extensions(v)
+            for k, v in node.items()
+            if not ((isinstance(k, str) and k.startswith("x-")) or k == "default")
+        }
+    if isinstance(node, list):
+        # Like _strip_extensions, only dict items of a list are stripped
+        return [_copy_without_extensions(item) if isinstance(item, dict) else clone_json(item) for item in node]
+    return node
+
+
+def _enforce_strict_rules(node: dict[str, Any]) -> None:
+    """Apply strict mode rules to one object schema; ``_make_strict`` walks the tree."""
     if node.get("type") == "object" and "properties" in node:
         node["additionalProperties"] = False
-        existing_required = set(node.get("required", []))
-        all_names = list(node["properties"].keys())
-        optional_names = [n for n in all_names if n not in existing_required]
-
-        for name in optional_names:
-            prop = node["properties"][name]
+        # No set to build for the common object without a required list
+        existing_required = set(node["required"]) if node.get("required") else frozenset()
+        properties = node["properties"]
+        all_names = list(properties)
+
+        for name in all_names:
+            if name in existing_required:
+                continue
+            prop = properties[name]
             if "type" in prop:
                 if isinstance(prop["type"], str):
                     prop["type"] = [prop["type"], "null"]
@@ -85,21 +179,6 @@ def _convert_to_strict(node: Any) -> None:
                         prop["type"].append("null")
             else:
                 # Pure $ref or composition — wrap in oneOf with null
-                node["properties"][name] = {"oneOf": [prop, {"type": "null"}]}
+                properties[name] = {"oneOf": [prop, {"type": "null"}]}
 
         node["required"] = sorted(all_names)
-
-    # Recurse into nested structures
-    if "properties" in node and isinstance(node["properties"], dict):
-        for prop in node["properties"].values():
-            _convert_to_strict(prop)
-    if "items" in node and isinstance(node["items"], dict):
-        _convert_to_strict(node["items"])
-    for keyword in ("oneOf", "anyOf", "allOf"):
-        if keyword in node and isinstance(node[keyword], list):
-            for sub in node[keyword]:
-                _convert_to_strict(sub)
-    for defs_key in ("definitions", "$defs"):
-        if defs_key in node and isinstance(node[defs_key], dict):
-            for defn in node[defs_key].values():
-                _convert_to_strict(defn)
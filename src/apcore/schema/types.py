@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
 from pydantic import BaseModel
@@ -20,6 +21,10 @@ __all__ = [
     "LLMExtensions",
 ]
 
+# Keys of each error dict in SchemaValidationError, read off a detail in one call
+_ERROR_DETAIL_KEYS = ("path", "message", "constraint", "expected", "actual")
+_error_detail_values = attrgetter(*_ERROR_DETAIL_KEYS)
+
 
 class SchemaStrategy(str, Enum):
     """Controls how SchemaLoader resolves schemas."""
@@ -38,7 +43,7 @@ class ExportProfile(str, Enum):
     GENERIC = "generic"
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaDefinition:
     """Represents a parsed *.schema.yaml file before $ref resolution."""
 
@@ -53,7 +58,7 @@ class SchemaDefinition:
     schema_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolvedSchema:
     """A schema after all $ref references have been inlined, paired with its generated Pydantic model."""
 
@@ -63,7 +68,7 @@ class ResolvedSchema:
     direction: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchemaValidationErrorDetail:
     """One validation error in the PROTOCOL_SPEC section 4.14 format."""
 
@@ -74,7 +79,7 @@ class SchemaValidationErrorDetail:
     actual: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaValidationResult:
     """Aggregation of validation errors."""
 
@@ -85,20 +90,11 @@ class SchemaValidationResult:
         """Convert this validation result into a SchemaValidationError exception."""
         if self.valid:
             raise ValueError("Cannot convert valid result to error")
-        error_dicts = [
-            {
-                "path": e.path,
-                "message": e.message,
-                "constraint": e.constraint,
-                "expected": e.expected,
-                "actual": e.actual,
-            }
-            for e in self.errors
-        ]
+        error_dicts = [dict(zip(_ERROR_DETAIL_KEYS, _error_detail_values(e))) for e in self.errors]
         return SchemaValidationError(message="Schema validation failed", errors=error_dicts)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMExtensions:
     """Extracted x-* extension fields from a schema property."""
 
@@ -47,15 +47,25 @@ class SchemaValidator:
 
     def __init__(self, coerce_types: bool = True) -> None:
         self._coerce_types = coerce_types
+        self._strict = not coerce_types
 
     def validate(self, data: dict[str, Any], model: type[BaseModel]) -> SchemaValidationResult:
         """Validate data against a Pydantic model, returning a result object."""
         try:
-            model.model_validate(data, strict=not self._coerce_types)
+            # pydantic caches the core validator and serializer on the model class
+            model.__pydantic_validator__.validate_python(data, strict=self._strict)
             return SchemaValidationResult(valid=True, errors=[])
         except PydanticValidationError as e:
             return SchemaValidationResult(valid=False, errors=self._pydantic_error_to_details(e))
 
+    def is_valid(self, data: dict[str, Any], model: type[BaseModel]) -> bool:
+        """Return whether data validates against the model, without building errors or a result.
+
+        For callers that only need a yes/no answer, such as policy checks.
+        No model instance is kept and no error details are produced.
+        """
+        return model.__pydantic_validator__.isinstance_python(data, strict=self._strict)
+
     def validate_input(self, data: dict[str, Any], model: type[BaseModel]) -> dict[str, Any]:
         """Validate input data and return the validated dict. Raises SchemaValidationError on failure."""
         return self._validate_and_dump(data, model)
@@ -67,43 +77,37 @@ class SchemaValidator:
     def _validate_and_dump(self, data: dict[str, Any], model: type[BaseModel]) -> dict[str, Any]:
         """Validate data and return model_dump(). Raises SchemaValidationError on failure."""
         try:
-            instance = model.model_validate(data, strict=not self._coerce_types)
-            return instance.model_dump()
+            instance = model.__pydantic_validator__.validate_python(data, strict=self._strict)
         except PydanticValidationError as e:
             result = SchemaValidationResult(valid=False, errors=self._pydantic_error_to_details(e))
             raise result.to_error() from e
+        return model.__pydantic_serializer__.to_python(instance)
 
     def _pydantic_error_to_details(self, error: PydanticValidationError) -> list[SchemaValidationErrorDetail]:
         """Convert Pydantic v2 ValidationError to apcore error details."""
-        details: list[SchemaValidationErrorDetail] = []
-        for err in error.errors():
-            loc = err.get("loc", ())
-            path = "/" + "/".join(str(segment) for segment in loc) if loc else "/"
-
-            pydantic_type = err.get("type", "")
-            constraint = _PYDANTIC_TO_CONSTRAINT.get(pydantic_type, pydantic_type)
-
-            message = err.get("msg", "")
-
-            ctx = err.get("ctx", {})
-            expected: Any = None
-            for key in _EXPECTED_KEYS:
-                val = ctx.get(key)
-                if val is not None:
-                    expected = val
-                    break
-
-            actual = ctx.get("actual")
-            if actual is None:
-                actual = err.get("input")
-
-            details.append(
-                SchemaValidationErrorDetail(
-                    path=path,
-                    message=message,
-                    constraint=constraint,
-                    expected=expected,
-                    actual=actual,
-                )
-            )
-        return details
+        # URLs are never reported, so pydantic need not build them
+        return [_error_to_detail(err) for err in error.errors(include_url=False)]
+
+
+def _error_to_detail(err: Any) -> SchemaValidationErrorDetail:
+    """Convert one pydantic error dict to an apcore error detail."""
+    loc = err.get("loc", ())
+    path = "/" + "/".join(map(str, loc)) if loc else "/"
+
+    pydantic_type = err.get("type", "")
+    ctx = err.get("ctx", {})
+    # First constraint value that is present and not None, as the keys are ordered
+    expected = next((val for val in map(ctx.get, _EXPECTED_KEYS) if val is not None), None)
+
+    actual = ctx.get("actual")
+    if actual is None:
+        actual = err.get("input")
+
+    # Positional, in field order: path, message, constraint, expected, actual
+    return SchemaValidationErrorDetail(
+        path,
+        err.get("msg", ""),
+        _PYDANTIC_TO_CONSTRAINT.get(pydantic_type, pydantic_type),
+        expected,
+        actual,
+    )
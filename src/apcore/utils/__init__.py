@@ -1,5 +1,6 @@
 """Utility functions for the apcore framework."""
 
-from apcore.utils.pattern import match_pattern
+from apcore.utils.clone import clone_json
+from apcore.utils.pattern import compile_pattern, match_pattern
 
-__all__ = ["match_pattern"]
+__all__ = ["clone_json", "compile_pattern", "match_pattern"]
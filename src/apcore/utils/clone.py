@@ -0,0 +1,28 @@
+"""Copying of JSON-like data."""
+
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["clone_json"]
+
+
+def clone_json(node: Any) -> Any:
+    """Deep-copy a JSON-like tree of dicts and lists.
+
+    Schema documents hold only plain containers and immutable scalars, so
+    this skips ``copy.deepcopy``'s dispatch table and memo bookkeeping.
+    Scalars are returned as-is.
+
+    Args:
+        node: A dict, list or scalar, as produced by ``json.load`` or ``yaml.safe_load``.
+
+    Returns:
+        A copy sharing no dicts or lists with ``node``.
+    """
+    node_type = type(node)
+    if node_type is dict:
+        return {k: clone_json(v) for k, v in node.items()}
+    if node_type is list:
+        return [clone_json(item) for item in node]
+    return node
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-__all__ = ["match_pattern"]
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+__all__ = ["compile_pattern", "match_pattern"]
 
 
 def match_pattern(pattern: str, module_id: str) -> bool:
@@ -18,29 +22,55 @@ def match_pattern(pattern: str, module_id: str) -> bool:
     Returns:
         True if the module_id matches the pattern, False otherwise.
     """
-    if pattern == "*":
-        return True
-    if "*" not in pattern:
-        return pattern == module_id
+    return _compile(pattern)(module_id)
+
+
+def compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Compile a wildcard pattern into a reusable predicate over module IDs.
+
+    ``compile_pattern(pattern)(module_id)`` is equivalent to
+    ``match_pattern(pattern, module_id)``; callers that test one pattern
+    against many IDs can keep the predicate and skip the per-call lookup.
+
+    Args:
+        pattern: The pattern to compile. May contain '*' wildcards.
+
+    Returns:
+        A callable that returns True for module IDs matching the pattern.
+    """
+    return _compile(pattern)
 
-    segments = pattern.split("*")
-    pos = 0
 
-    if not pattern.startswith("*"):
-        if not module_id.startswith(segments[0]):
-            return False
-        pos = len(segments[0])
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> Callable[[str], bool]:
+    """Compile a wildcard pattern into a predicate over module IDs.
 
-    for segment in segments[1:]:
-        if not segment:
-            continue
-        idx = module_id.find(segment, pos)
-        if idx == -1:
-            return False
-        pos = idx + len(segment)
+    Patterns with at most one '*', and '*X*', are checked with plain string
+    methods; anything else becomes an anchored regex.
+    """
+    if "*" not in pattern:
+        return lambda module_id: module_id == pattern
 
-    if not pattern.endswith("*"):
-        if not module_id.endswith(segments[-1]):
-            return False
+    parts = pattern.split("*")
+    if len(parts) == 2:
+        prefix, suffix = parts
+        if not prefix and not suffix:
+            return lambda module_id: True
+        min_length = len(prefix) + len(suffix)
+        return lambda module_id: (
+            len(module_id) >= min_length and module_id.startswith(prefix) and module_id.endswith(suffix)
+        )
+    if len(parts) == 3 and not parts[0] and not parts[2]:
+        infix = parts[1]
+        return lambda module_id: infix in module_id
 
-    return True
+    # DOTALL: '*' matches any character, as in the segment-scanning original
+    fullmatch = re.compile(".*".join(re.escape(part) for part in parts), re.DOTALL).fullmatch
+    if parts[0]:
+        # A literal prefix already makes the regex fail at the first mismatch
+        return lambda module_id: fullmatch(module_id) is not None
+    # With a leading '*' the regex would backtrack through every start position
+    # before failing; most IDs are rejected by a substring test for the longest
+    # literal part first
+    anchor = max(parts, key=len)
+    return lambda module_id: anchor in module_id and fullmatch(module_id) is not None
@@ -153,10 +153,7 @@ def executor(mock_registry: Registry) -> Executor:
     return Executor(registry=mock_registry)
 
 
-@pytest.fixture
-def acl_yaml(tmp_path: Any) -> str:
-    """Write a sample ACL YAML file and return its path."""
-    content = """
+_SAMPLE_ACL_YAML = """
 rules:
   - callers: ["test.*"]
     targets: ["test.*"]
@@ -166,8 +163,13 @@ rules:
     effect: deny
 default_effect: deny
 """
-    yaml_file = tmp_path / "acl.yaml"
-    yaml_file.write_text(content)
+
+
+@pytest.fixture(scope="session")
+def acl_yaml(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write a sample ACL YAML file once per session and return its path."""
+    yaml_file = tmp_path_factory.mktemp("acl") / "acl.yaml"
+    yaml_file.write_text(_SAMPLE_ACL_YAML)
     return str(yaml_file)
 
 
@@ -0,0 +1,45 @@
+"""Session-scoped fixtures that load each example module once."""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+from types import ModuleType
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
+
+
+def _load_example_module(relative_path: str) -> ModuleType:
+    """Load a Python module from a path relative to PROJECT_ROOT using importlib."""
+    full_path = PROJECT_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(full_path.stem, str(full_path))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def greet_mod() -> ModuleType:
+    return _load_example_module("examples/modules/greet.py")
+
+
+@pytest.fixture(scope="session")
+def send_email_mod() -> ModuleType:
+    return _load_example_module("examples/modules/send_email.py")
+
+
+@pytest.fixture(scope="session")
+def get_user_mod() -> ModuleType:
+    return _load_example_module("examples/modules/get_user.py")
+
+
+@pytest.fixture(scope="session")
+def decorated_add_mod() -> ModuleType:
+    return _load_example_module("examples/modules/decorated_add.py")
+
+
+@pytest.fixture(scope="session")
+def format_date_mod() -> ModuleType:
+    return _load_example_module("examples/bindings/format_date/format_date.py")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import importlib.util
 import pathlib
 
 import yaml
@@ -14,42 +13,29 @@ from apcore.module import ModuleAnnotations, ModuleExample
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
 
 
-def _load_example_module(relative_path: str):
-    """Load a Python module from a path relative to PROJECT_ROOT using importlib."""
-    full_path = PROJECT_ROOT / relative_path
-    spec = importlib.util.spec_from_file_location(full_path.stem, str(full_path))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
 # --- GreetModule Tests ---
 
 
 class TestGreetModule:
     """Test: GreetModule instantiable with required attributes."""
 
-    def test_greet_module_has_input_schema(self):
-        mod = _load_example_module("examples/modules/greet.py")
-        instance = mod.GreetModule()
+    def test_greet_module_has_input_schema(self, greet_mod):
+        instance = greet_mod.GreetModule()
         assert hasattr(instance, "input_schema")
         assert issubclass(instance.input_schema, BaseModel)
 
-    def test_greet_module_has_output_schema(self):
-        mod = _load_example_module("examples/modules/greet.py")
-        instance = mod.GreetModule()
+    def test_greet_module_has_output_schema(self, greet_mod):
+        instance = greet_mod.GreetModule()
         assert hasattr(instance, "output_schema")
         assert issubclass(instance.output_schema, BaseModel)
 
-    def test_greet_module_has_description(self):
-        mod = _load_example_module("examples/modules/greet.py")
-        instance = mod.GreetModule()
+    def test_greet_module_has_description(self, greet_mod):
+        instance = greet_mod.GreetModule()
         assert isinstance(instance.description, str)
         assert len(instance.description) > 0
 
-    def test_greet_module_execute_returns_correct_greeting(self):
-        mod = _load_example_module("examples/modules/greet.py")
-        instance = mod.GreetModule()
+    def test_greet_module_execute_returns_correct_greeting(self, greet_mod):
+        instance = greet_mod.GreetModule()
         ctx = Context.create()
         result = instance.execute({"name": "Alice"}, ctx)
         assert result == {"message": "Hello, Alice!"}
@@ -61,40 +47,34 @@ class TestGreetModule:
 class TestSendEmailModule:
     """Test: SendEmailModule has annotations, tags, version, examples."""
 
-    def test_send_email_has_annotations(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        instance = mod.SendEmailModule()
+    def test_send_email_has_annotations(self, send_email_mod):
+        instance = send_email_mod.SendEmailModule()
         assert isinstance(instance.annotations, ModuleAnnotations)
         assert instance.annotations.destructive is True
         assert instance.annotations.idempotent is False
 
-    def test_send_email_has_tags(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        instance = mod.SendEmailModule()
+    def test_send_email_has_tags(self, send_email_mod):
+        instance = send_email_mod.SendEmailModule()
         assert isinstance(instance.tags, list)
         assert len(instance.tags) > 0
 
-    def test_send_email_has_version(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        instance = mod.SendEmailModule()
+    def test_send_email_has_version(self, send_email_mod):
+        instance = send_email_mod.SendEmailModule()
         assert isinstance(instance.version, str)
 
-    def test_send_email_has_examples(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        instance = mod.SendEmailModule()
+    def test_send_email_has_examples(self, send_email_mod):
+        instance = send_email_mod.SendEmailModule()
         assert isinstance(instance.examples, list)
         assert len(instance.examples) > 0
         assert isinstance(instance.examples[0], ModuleExample)
 
-    def test_send_email_input_schema_has_sensitive_field(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        schema = mod.SendEmailInput.model_json_schema()
+    def test_send_email_input_schema_has_sensitive_field(self, send_email_mod):
+        schema = send_email_mod.SendEmailInput.model_json_schema()
         api_key_props = schema["properties"]["api_key"]
         assert api_key_props.get("x-sensitive") is True
 
-    def test_send_email_execute_returns_status(self):
-        mod = _load_example_module("examples/modules/send_email.py")
-        instance = mod.SendEmailModule()
+    def test_send_email_execute_returns_status(self, send_email_mod):
+        instance = send_email_mod.SendEmailModule()
         ctx = Context.create()
         child = ctx.child("send_email")
         result = instance.execute(
@@ -116,19 +96,16 @@ class TestSendEmailModule:
 class TestGetUserModule:
     """Test: GetUserModule has readonly and idempotent annotations."""
 
-    def test_get_user_has_readonly_annotation(self):
-        mod = _load_example_module("examples/modules/get_user.py")
-        instance = mod.GetUserModule()
+    def test_get_user_has_readonly_annotation(self, get_user_mod):
+        instance = get_user_mod.GetUserModule()
         assert instance.annotations.readonly is True
 
-    def test_get_user_has_idempotent_annotation(self):
-        mod = _load_example_module("examples/modules/get_user.py")
-        instance = mod.GetUserModule()
+    def test_get_user_has_idempotent_annotation(self, get_user_mod):
+        instance = get_user_mod.GetUserModule()
         assert instance.annotations.idempotent is True
 
-    def test_get_user_execute_returns_user_data(self):
-        mod = _load_example_module("examples/modules/get_user.py")
-        instance = mod.GetUserModule()
+    def test_get_user_execute_returns_user_data(self, get_user_mod):
+        instance = get_user_mod.GetUserModule()
         ctx = Context.create()
         result = instance.execute({"user_id": "user-1"}, ctx)
         assert result == {"id": "user-1", "name": "Alice", "email": "alice@example.com"}
@@ -140,13 +117,11 @@ class TestGetUserModule:
 class TestDecoratedAdd:
     """Test: decorated add function has apcore_module attribute."""
 
-    def test_add_has_apcore_module_attribute(self):
-        mod = _load_example_module("examples/modules/decorated_add.py")
-        assert hasattr(mod.add, "apcore_module")
+    def test_add_has_apcore_module_attribute(self, decorated_add_mod):
+        assert hasattr(decorated_add_mod.add, "apcore_module")
 
-    def test_add_module_produces_correct_sum(self):
-        mod = _load_example_module("examples/modules/decorated_add.py")
-        fm = mod.add.apcore_module
+    def test_add_module_produces_correct_sum(self, decorated_add_mod):
+        fm = decorated_add_mod.add.apcore_module
         ctx = Context.create()
         result = fm.execute({"a": 2, "b": 3}, ctx)
         assert result == {"result": 5}
@@ -168,7 +143,6 @@ class TestFormatDateBinding:
         assert "module_id" in entry
         assert "target" in entry
 
-    def test_format_date_function_formats_dates(self):
-        mod = _load_example_module("examples/bindings/format_date/format_date.py")
-        result = mod.format_date_string("2024-01-15", "%B %d, %Y")
+    def test_format_date_function_formats_dates(self, format_date_mod):
+        result = format_date_mod.format_date_string("2024-01-15", "%B %d, %Y")
         assert result == {"formatted": "January 15, 2024"}
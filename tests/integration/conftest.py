@@ -118,7 +118,9 @@ def int_extensions_dir(tmp_path):
     sys.path.insert(0, str(ext_dir))
     yield ext_dir
     sys.path.remove(str(ext_dir))
-    for name in ["apcore_ext_greet", "apcore_ext_failing", "apcore_ext_async_greet"]:
+    for name in [
+        n for n in sys.modules if n.startswith(("apcore_ext_greet_", "apcore_ext_failing_", "apcore_ext_async_greet_"))
+    ]:
         sys.modules.pop(name, None)
 
 
@@ -137,12 +139,18 @@ def int_executor(int_registry):
     return Executor(registry=int_registry)
 
 
+@pytest.fixture(scope="session")
+def int_acl_yaml(tmp_path_factory):
+    """ACL rules file, written once per session; tests only read it."""
+    acl_path = tmp_path_factory.mktemp("acl") / "acl.yaml"
+    acl_path.write_text(ACL_YAML_CONTENT)
+    return str(acl_path)
+
+
 @pytest.fixture
-def int_acl_executor(int_registry, tmp_path):
+def int_acl_executor(int_registry, int_acl_yaml):
     """Executor with integration test registry and ACL rules."""
-    acl_path = tmp_path / "acl.yaml"
-    acl_path.write_text(ACL_YAML_CONTENT)
-    acl = ACL.load(str(acl_path))
+    acl = ACL.load(int_acl_yaml)
     return Executor(registry=int_registry, acl=acl)
 
 
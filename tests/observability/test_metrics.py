@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 import threading
+from enum import StrEnum
 
 
 from apcore.context import Context
@@ -44,6 +46,28 @@ class TestMetricsCollectorIncrement:
         assert snap["counters"][("calls", (("module", "a"),))] == 2
         assert snap["counters"][("calls", (("module", "b"),))] == 1
 
+    def test_increment_interns_label_strings(self):
+        """Short label values built at runtime are interned in counter keys."""
+        c = MetricsCollector()
+        suffix = ".a"
+        c.increment_calls(f"mod{suffix}", "success")
+        ((_name, labels),) = c.snapshot()["counters"]
+        module_id = dict(labels)["module_id"]
+        assert module_id is sys.intern("mod.a")
+
+    def test_increment_accepts_str_subclass_and_long_labels(self):
+        """StrEnum values and labels over the intern limit are recorded as given."""
+
+        class Status(StrEnum):
+            OK = "ok"
+
+        c = MetricsCollector()
+        long_id = "m" * 100
+        c.increment_calls(long_id, Status.OK)
+        c.observe_duration(long_id, 0.1)
+        key = ("apcore_module_calls_total", (("module_id", long_id), ("status", "ok")))
+        assert c.snapshot()["counters"][key] == 1
+
 
 # --- MetricsCollector Observe Tests ---
 
@@ -81,6 +105,17 @@ class TestMetricsCollectorObserve:
         lk = (("mod", "a"),)
         assert snap["histograms"]["buckets"][("duration", lk, float("inf"))] == 1
 
+    def test_observe_buckets_are_cumulative(self):
+        """Bucket counts include every observation at or below the bound."""
+        c = MetricsCollector(buckets=[1.0, 5.0])
+        for value in (0.5, 1.0, 3.0, 7.0):
+            c.observe("duration", {"mod": "a"}, value)
+        buckets = c.snapshot()["histograms"]["buckets"]
+        lk = (("mod", "a"),)
+        assert buckets[("duration", lk, 1.0)] == 2
+        assert buckets[("duration", lk, 5.0)] == 3
+        assert buckets[("duration", lk, float("inf"))] == 4
+
 
 # --- Snapshot and Reset ---
 
@@ -144,6 +179,39 @@ class TestMetricsCollectorPrometheus:
         assert "apcore_module_duration_seconds_sum" in output
         assert "apcore_module_duration_seconds_count" in output
 
+    def test_export_prometheus_label_formatting(self):
+        """Labels render sorted by key for zero, three, and histogram-bucket cases."""
+        c = MetricsCollector(buckets=[1.0])
+        c.increment("plain", {})
+        c.increment("multi", {"c": "3", "a": "1", "b": "2"})
+        c.observe("h", {}, 0.5)
+        output = c.export_prometheus()
+        assert "plain 1" in output
+        assert 'multi{a="1",b="2",c="3"} 1' in output
+        assert 'h_bucket{le="1"} 1' in output
+        assert "h_sum 0.5" in output
+
+    def test_export_prometheus_groups_series_by_metric(self):
+        """Each metric family has a single header followed by its series in first-seen order."""
+        c = MetricsCollector()
+        c.increment("calls", {"m": "b"})
+        c.increment("errors", {"m": "a"})
+        c.increment("calls", {"m": "a"})
+        lines = c.export_prometheus().splitlines()
+        assert lines.count("# TYPE calls counter") == 1
+        assert lines.index('calls{m="b"} 1') < lines.index('calls{m="a"} 1') < lines.index("# TYPE errors counter")
+
+    def test_export_prometheus_cumulative_bucket_lines(self):
+        """Bucket lines report cumulative counts per bound."""
+        c = MetricsCollector(buckets=[1.0, 5.0])
+        c.observe("h", {"m": "a"}, 0.5)
+        c.observe("h", {"m": "a"}, 3.0)
+        output = c.export_prometheus()
+        assert 'h_bucket{m="a",le="1"} 1' in output
+        assert 'h_bucket{m="a",le="5"} 2' in output
+        assert 'h_bucket{m="a",le="+Inf"} 2' in output
+        assert 'h_count{m="a"} 2' in output
+
 
 # --- Configuration ---
 
@@ -187,6 +255,35 @@ class TestMetricsCollectorThreadSafety:
         snap = c.snapshot()
         assert snap["counters"][("counter", (("t", "1"),))] == 10000
 
+    def test_counts_from_finished_threads_survive_repeated_snapshots(self):
+        """Counts recorded by a thread that has exited stay in later snapshots."""
+        c = MetricsCollector()
+        t = threading.Thread(target=lambda: c.increment("counter", {"t": "1"}, 5))
+        t.start()
+        t.join()
+        c.increment("counter", {"t": "1"})
+        key = ("counter", (("t", "1"),))
+        assert c.snapshot()["counters"][key] == 6
+        assert c.snapshot()["counters"][key] == 6
+
+    def test_finished_threads_pruned_without_snapshots(self):
+        """Stores of exited threads are folded in when new threads register."""
+        c = MetricsCollector()
+        for _ in range(20):
+            t = threading.Thread(target=lambda: c.increment("counter", {"t": "1"}))
+            t.start()
+            t.join()
+        assert len(c._thread_counters) == 1
+        assert c.snapshot()["counters"][("counter", (("t", "1"),))] == 20
+
+    def test_reset_discards_per_thread_counts(self):
+        """reset() drops counts already recorded by the calling thread."""
+        c = MetricsCollector()
+        c.increment("counter", {"t": "1"}, 3)
+        c.reset()
+        c.increment("counter", {"t": "1"})
+        assert c.snapshot()["counters"] == {("counter", (("t", "1"),)): 1}
+
 
 # --- Convenience Methods ---
 
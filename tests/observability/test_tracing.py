@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
 import threading
 import time
@@ -19,6 +20,7 @@ from apcore.observability.tracing import (
     SpanExporter,
     StdoutExporter,
     TracingMiddleware,
+    _thread_random,
 )
 
 
@@ -38,6 +40,29 @@ class TestSpan:
         assert len(span.span_id) == 16
         assert all(c in "0123456789abcdef" for c in span.span_id)
 
+    def test_span_ids_are_unique_across_pool_refills(self):
+        """span_id values stay unique when the random byte pool is refilled."""
+        ids = {Span(trace_id="abc-123", name="test", start_time=0.0).span_id for _ in range(2000)}
+        assert len(ids) == 2000
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_repeat_parent_span_ids(self):
+        """A forked child refills its span ID pool instead of reusing the parent's copy."""
+        Span(trace_id="abc-123", name="test", start_time=0.0)  # fill the parent's pool
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, Span(trace_id="abc-123", name="test", start_time=0.0).span_id.encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        parent_id = Span(trace_id="abc-123", name="test", start_time=0.0).span_id
+        assert len(child_id) == 16
+        assert child_id != parent_id
+
     def test_end_time_defaults_to_none(self):
         """end_time should default to None when not explicitly set."""
         span = Span(trace_id="abc-123", name="test", start_time=time.time())
@@ -107,6 +132,16 @@ class TestStdoutExporter:
         assert data["start_time"] == 1000.0
         assert data["end_time"] == 1001.0
 
+    def test_export_json_matches_all_span_fields(self, capsys):
+        """Exported JSON contains exactly the Span dataclass fields."""
+        import dataclasses
+
+        exporter = StdoutExporter()
+        span = Span(trace_id="trace-1", name="test.span", start_time=1000.0, events=[{"name": "e"}])
+        exporter.export(span)
+        data = json.loads(capsys.readouterr().out.strip())
+        assert data == json.loads(json.dumps(dataclasses.asdict(span), default=str))
+
 
 class TestInMemoryExporter:
     """Tests for InMemoryExporter."""
@@ -364,18 +399,29 @@ class TestSampling:
         mw.after("mod.a", {"x": 1}, {"result": "ok"}, ctx)
         assert len(exporter.get_spans()) == 1
 
-    def test_sampling_rate_0_never_samples_but_creates_span(self):
-        """sampling_rate=0.0 never samples (but still creates span)."""
+    def test_sampling_rate_0_never_samples_and_skips_span(self):
+        """sampling_rate=0.0 never samples and pushes a placeholder instead of a Span."""
         exporter = InMemoryExporter()
         mw = TracingMiddleware(exporter=exporter, sampling_rate=0.0, sampling_strategy="proportional")
         ctx = Context.create()
         mw.before("mod.a", {"x": 1}, ctx)
-        # Span was created on the stack
+        # A placeholder keeps the stack balanced, but no Span was built
         assert len(ctx.data["_tracing_spans"]) == 1
+        assert not isinstance(ctx.data["_tracing_spans"][0], Span)
         mw.after("mod.a", {"x": 1}, {"result": "ok"}, ctx)
         # But not exported
         assert len(exporter.get_spans()) == 0
 
+    def test_sampling_rate_1_samples_every_call(self):
+        """sampling_rate=1.0 maps to a threshold above every 32-bit draw."""
+        exporter = InMemoryExporter()
+        mw = TracingMiddleware(exporter=exporter, sampling_rate=1.0, sampling_strategy="proportional")
+        for _ in range(200):
+            ctx = Context.create()
+            mw.before("mod.a", {}, ctx)
+            mw.after("mod.a", {}, {"r": 1}, ctx)
+        assert len(exporter.get_spans()) == 200
+
     def test_sampling_rate_rejects_negative(self):
         """sampling_rate validation rejects negative values."""
         with pytest.raises(ValueError):
@@ -409,6 +455,14 @@ class TestSampling:
         mw.after("mod.a", {}, {"r": 1}, ctx)
         assert len(exporter.get_spans()) == 0
 
+    def test_off_strategy_leaves_context_untouched(self):
+        """'off' strategy skips all bookkeeping in context.data."""
+        mw = TracingMiddleware(exporter=InMemoryExporter(), sampling_strategy="off")
+        ctx = Context.create()
+        mw.before("mod.a", {}, ctx)
+        mw.on_error("mod.a", {}, RuntimeError("fail"), ctx)
+        assert ctx.data == {}
+
     def test_proportional_strategy_exports_proportionally(self):
         """'proportional' strategy exports proportionally (statistical test)."""
         exporter = InMemoryExporter()
@@ -438,6 +492,18 @@ class TestSampling:
         mw.after("mod.a", {}, {"r": 1}, ctx)
         assert len(exporter.get_spans()) == 0
 
+    def test_unsampled_nested_calls_keep_stack_balanced(self):
+        """Unsampled nested calls (success and error) leave an empty stack."""
+        exporter = InMemoryExporter()
+        mw = TracingMiddleware(exporter=exporter, sampling_rate=0.0, sampling_strategy="proportional")
+        ctx = Context.create()
+        mw.before("mod.a", {}, ctx)
+        mw.before("mod.b", {}, ctx)
+        mw.on_error("mod.b", {}, RuntimeError("fail"), ctx)
+        mw.after("mod.a", {}, {"r": 1}, ctx)
+        assert ctx.data["_tracing_spans"] == []
+        assert len(exporter.get_spans()) == 0
+
     def test_sampling_decision_inherited_from_parent(self):
         """Sampling decision inherited from parent context (nested calls)."""
         exporter = InMemoryExporter()
@@ -450,6 +516,22 @@ class TestSampling:
         # Should export because parent decided to sample
         assert len(exporter.get_spans()) == 1
 
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_repeat_parent_sampling_draws(self):
+        """A forked child gets a freshly seeded sampling RNG instead of the parent's copy."""
+        _thread_random()  # create the parent's per-thread RNG
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, str(_thread_random().getrandbits(64)).encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_draw = int(os.read(read_fd, 64).decode())
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert child_draw != _thread_random().getrandbits(64)
+
 
 class TestTracingMiddleware:
     """Tests for TracingMiddleware before/after/on_error lifecycle."""
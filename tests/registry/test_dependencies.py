@@ -55,6 +55,28 @@ class TestSimpleOrdering:
         assert result.index("B") < result.index("A")
         assert result.index("C") < result.index("A")
 
+    def test_ready_modules_emitted_in_sorted_order(self) -> None:
+        """Among ready modules, the lexicographically smallest id is loaded first."""
+        result = resolve_dependencies(
+            [
+                ("z", []),
+                ("b", [DependencyInfo(module_id="z")]),
+                ("y", []),
+                ("a", [DependencyInfo(module_id="z")]),
+            ]
+        )
+        assert result == ["y", "z", "a", "b"]
+
+    def test_duplicate_dependency_is_not_a_cycle(self) -> None:
+        """Declaring the same dependency twice still resolves."""
+        result = resolve_dependencies(
+            [
+                ("A", [DependencyInfo(module_id="B"), DependencyInfo(module_id="B")]),
+                ("B", []),
+            ]
+        )
+        assert result == ["B", "A"]
+
 
 class TestCircularDetection:
     def test_simple_cycle(self) -> None:
@@ -137,3 +159,11 @@ class TestEdgeCases:
     def test_single_module(self) -> None:
         """Single module with no deps returns [module_id]."""
         assert resolve_dependencies([("A", [])]) == ["A"]
+
+    def test_known_dependency_outside_batch_is_not_loaded(self) -> None:
+        """A dependency listed in known_ids but not in the batch blocks its dependent."""
+        with pytest.raises(CircularDependencyError):
+            resolve_dependencies(
+                [("A", [DependencyInfo(module_id="X")]), ("B", [])],
+                known_ids={"A", "B", "X"},
+            )
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import pytest
 
 from apcore.errors import ModuleLoadError
-from apcore.registry.entry_point import resolve_entry_point, snake_to_pascal
+from apcore.registry.entry_point import (
+    _entry_point_cache,
+    clear_entry_point_cache,
+    resolve_entry_point,
+    snake_to_pascal,
+)
 
 
 # --- Module file content templates ---
@@ -134,6 +140,31 @@ class Utility:
         with pytest.raises(ModuleLoadError, match="No Module subclass"):
             resolve_entry_point(f)
 
+    def test_unchanged_file_returns_cached_class(self, tmp_path: Path) -> None:
+        """Resolving an unchanged file twice returns the same class object."""
+        f = tmp_path / "cached.py"
+        f.write_text(VALID_MODULE)
+        assert resolve_entry_point(f) is resolve_entry_point(f)
+
+    def test_modified_file_is_resolved_again(self, tmp_path: Path) -> None:
+        """A file whose contents change is re-imported instead of served from cache."""
+        f = tmp_path / "changing.py"
+        f.write_text(VALID_MODULE)
+        first = resolve_entry_point(f)
+        f.write_text(MODULE_PLUS_PLAIN)
+        second = resolve_entry_point(f)
+        assert first.__name__ == "MyTestModule"
+        assert second.__name__ == "MyModule"
+        assert _entry_point_cache[str(f)][1] is second  # the edit replaced the entry
+
+    def test_clear_entry_point_cache(self, tmp_path: Path) -> None:
+        """clear_entry_point_cache() forgets previously inferred classes."""
+        f = tmp_path / "cleared.py"
+        f.write_text(VALID_MODULE)
+        resolve_entry_point(f)
+        clear_entry_point_cache()
+        assert str(f) not in _entry_point_cache
+
 
 # === resolve_entry_point() meta override ===
 
@@ -153,6 +184,30 @@ class TestResolveEntryPointMeta:
         with pytest.raises(ModuleLoadError, match="not found"):
             resolve_entry_point(f, meta={"entry_point": "mymod:NonExistentClass"})
 
+    def test_meta_entry_point_reuses_imported_module(self, tmp_path: Path) -> None:
+        """Resolving an unchanged file again reuses the module from sys.modules."""
+        f = tmp_path / "reused.py"
+        f.write_text(TWO_MODULES)
+        first = resolve_entry_point(f, meta={"entry_point": "reused:ModuleA"})
+        second = resolve_entry_point(f, meta={"entry_point": "reused:ModuleB"})
+        assert first.__module__ == second.__module__
+        assert sys.modules[first.__module__].ModuleB is second
+
+    def test_same_stem_in_different_directories_kept_apart(self, tmp_path: Path) -> None:
+        """Files sharing a name in two directories get separate, reused modules."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        fa = tmp_path / "a" / "dup.py"
+        fb = tmp_path / "b" / "dup.py"
+        fa.write_text(TWO_MODULES)
+        fb.write_text(TWO_MODULES)
+        meta = {"entry_point": "dup:ModuleA"}
+        first_a = resolve_entry_point(fa, meta=meta)
+        first_b = resolve_entry_point(fb, meta=meta)
+        assert first_a.__module__ != first_b.__module__
+        assert resolve_entry_point(fa, meta=meta) is first_a
+        assert resolve_entry_point(fb, meta=meta) is first_b
+
 
 # === resolve_entry_point() error handling ===
 
@@ -179,6 +234,14 @@ class TestResolveEntryPointErrors:
         with pytest.raises(ModuleLoadError):
             resolve_entry_point(f)
 
+    def test_failed_import_not_left_in_sys_modules(self, tmp_path: Path) -> None:
+        """A module that fails to execute is removed from sys.modules."""
+        f = tmp_path / "halfway.py"
+        f.write_text('raise RuntimeError("boom")')
+        with pytest.raises(ModuleLoadError):
+            resolve_entry_point(f)
+        assert not any(name.startswith("apcore_ext_halfway_") for name in sys.modules)
+
 
 # === snake_to_pascal() ===
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import ClassVar
 
 import pytest
 import yaml
@@ -50,6 +51,29 @@ class TestLoadMetadata:
         with pytest.raises(ConfigError):
             load_metadata(meta)
 
+    def test_python_object_tag_rejected(self, tmp_path: Path) -> None:
+        """Unsafe python/* tags are rejected like with yaml.safe_load."""
+        meta = tmp_path / "unsafe_meta.yaml"
+        meta.write_text("value: !!python/object/apply:os.getcwd []")
+        with pytest.raises(ConfigError):
+            load_metadata(meta)
+
+    def test_cached_result_is_isolated_from_caller_changes(self, tmp_path: Path) -> None:
+        """Mutating a returned dict does not affect later loads of the same file."""
+        meta = tmp_path / "cached_meta.yaml"
+        meta.write_text(yaml.dump({"description": "cached"}))
+        first = load_metadata(meta)
+        first["entry_point"] = "cached:Other"
+        assert load_metadata(meta) == {"description": "cached"}
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Changing the file contents invalidates the cached parse."""
+        meta = tmp_path / "changing_meta.yaml"
+        meta.write_text(yaml.dump({"description": "old"}))
+        assert load_metadata(meta)["description"] == "old"
+        meta.write_text(yaml.dump({"description": "newer"}))
+        assert load_metadata(meta)["description"] == "newer"
+
     def test_partial_fields(self, tmp_path: Path) -> None:
         """YAML with only some fields returns partial dict."""
         meta = tmp_path / "partial_meta.yaml"
@@ -148,6 +172,21 @@ class TestMergeModuleMetadata:
         assert result["metadata"]["key2"] == "val2"
         assert result["metadata"]["shared"] == "yaml"
 
+    def test_empty_meta_matches_general_merge(self) -> None:
+        """Empty meta gives the same result as YAML with no overriding keys."""
+
+        class MockModule:
+            description = "d"
+            name = "n"
+            tags: ClassVar[list[str]] = ["t1"]
+            examples: ClassVar[list[dict[str, str]]] = [{"title": "e"}]
+            metadata: ClassVar[dict[str, str]] = {"key1": "val1"}
+            documentation = "docs"
+
+        result = merge_module_metadata(MockModule, {})
+        assert result == merge_module_metadata(MockModule, {"dependencies": []})
+        assert result["metadata"] is not MockModule.metadata
+
 
 # === load_id_map() ===
 
@@ -181,6 +220,7 @@ class TestLoadIdMap:
         f.write_text(yaml.dump({"mappings": [{"file": "mod.py", "id": "m", "class": "MyClass"}]}))
         result = load_id_map(f)
         assert result["mod.py"]["class"] == "MyClass"
+        assert result["mod.py"]["entry_point"] == "mod:MyClass"
 
     def test_nonexistent_raises(self, tmp_path: Path) -> None:
         """Non-existent file raises ConfigNotFoundError."""
@@ -200,3 +240,4 @@ class TestLoadIdMap:
         f.write_text(yaml.dump({"mappings": [{"file": "mod.py", "id": "my.mod"}]}))
         result = load_id_map(f)
         assert result["mod.py"]["class"] is None
+        assert result["mod.py"]["entry_point"] is None
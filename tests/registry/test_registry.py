@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
@@ -339,6 +340,28 @@ class TestQueryMethods:
         result = reg.list(prefix="foo", tags=["test", "sample"])
         assert result == ["foo.a"]
 
+    def test_list_tags_after_unregister(self) -> None:
+        """Unregistered modules no longer match tag queries."""
+        reg = Registry()
+        reg.register("mod.a", _ValidModule())  # tags=["test", "sample"]
+        reg.register("mod.b", _ValidModuleB())  # tags=["test"]
+        reg.unregister("mod.a")
+        assert reg.list(tags=["sample"]) == []
+        assert reg.list(tags=["test"]) == ["mod.b"]
+        assert "sample" not in reg._tag_index
+
+    def test_list_tags_set_in_on_load(self) -> None:
+        """Tags assigned by on_load() are visible to tag queries."""
+
+        class LateTagged(_ValidModuleB):
+            def on_load(self) -> None:
+                self.tags = ["late"]
+
+        reg = Registry()
+        reg.register("mod.late", LateTagged())
+        assert reg.list(tags=["late"]) == ["mod.late"]
+        assert reg.list(tags=["test"]) == []
+
     def test_iter(self) -> None:
         """iter() returns (id, module) tuples."""
         reg = Registry()
@@ -390,6 +413,45 @@ class TestGetDefinition:
         reg = Registry()
         assert reg.get_definition("missing") is None
 
+    def test_definition_schemas_generated_once(self) -> None:
+        """Repeated get_definition() calls reuse the cached JSON schemas."""
+
+        class FreshInput(BaseModel):
+            value: str
+
+        class FreshModule(_ValidModule):
+            input_schema = FreshInput
+
+        reg = Registry()
+        reg.register("test.module", FreshModule())
+        with patch.object(FreshInput, "model_json_schema", wraps=FreshInput.model_json_schema) as spy:
+            first = reg.get_definition("test.module")
+            second = reg.get_definition("test.module")
+        assert spy.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_definition_copies_are_independent(self) -> None:
+        """Modifying a returned descriptor does not leak into later calls."""
+        reg = Registry()
+        reg.register("test.module", _ValidModule())
+        first = reg.get_definition("test.module")
+        first.input_schema["properties"].clear()
+        first.tags.append("mutated")
+        second = reg.get_definition("test.module")
+        assert second.input_schema["properties"]
+        assert "mutated" not in second.tags
+
+    def test_definition_cache_dropped_on_unregister(self) -> None:
+        """A module re-registered under the same ID gets a fresh descriptor."""
+        reg = Registry()
+        reg.register("test.module", _ValidModule())
+        assert reg.get_definition("test.module").version == "2.0.0"
+        reg.unregister("test.module")
+        reg.register("test.module", _ValidModuleB())
+        defn = reg.get_definition("test.module")
+        assert defn.description == _ValidModuleB.description
+
 
 # ===== Event Callbacks =====
 
@@ -516,6 +578,48 @@ class TestDiscover:
         meta_info = reg._module_meta.get("mymod", {})
         assert meta_info.get("description") == "YAML description"
         assert meta_info.get("tags") == ["yaml_tag"]
+        assert reg.list(tags=["yaml_tag"]) == ["mymod"]
+
+    def test_discover_with_many_metadata_files(self, tmp_path: Path) -> None:
+        """discover() pairs each module with its own metadata when parsing in parallel."""
+        ext = tmp_path / "extensions"
+        ext.mkdir()
+        for i in range(12):
+            _write_module_file(ext / f"mod{i}.py", f"Mod{i}Module", "Code description")
+            (ext / f"mod{i}_meta.yaml").write_text(yaml.dump({"description": f"YAML {i}"}))
+        _write_module_file(ext / "plain.py", "PlainModule", "Plain description")
+        reg = Registry(extensions_dir=str(ext))
+        assert reg.discover() == 13
+        for i in range(12):
+            assert reg._module_meta[f"mod{i}"]["description"] == f"YAML {i}"
+        assert reg._module_meta["plain"]["description"] == "Plain description"
+
+    def test_discover_applies_id_map_override(self, tmp_path: Path) -> None:
+        """discover() renames modules listed in the ID map by their root-relative path."""
+        ext = tmp_path / "extensions"
+        (ext / "sub").mkdir(parents=True)
+        _write_module_file(ext / "sub" / "mapped.py", "MappedModule", "Mapped")
+        _write_module_file(ext / "unmapped.py", "UnmappedModule", "Unmapped")
+        id_map = tmp_path / "id_map.yaml"
+        id_map.write_text(yaml.dump({"mappings": [{"file": os.path.join("sub", "mapped.py"), "id": "renamed.mod"}]}))
+        reg = Registry(extensions_dir=str(ext), id_map_path=str(id_map))
+        assert reg.discover() == 2
+        assert reg.has("renamed.mod")
+        assert not reg.has("sub.mapped")
+        assert reg.has("unmapped")
+
+    def test_discover_applies_id_map_class_override(self, tmp_path: Path) -> None:
+        """discover() loads the class named in the ID map when a file defines several."""
+        ext = tmp_path / "extensions"
+        ext.mkdir()
+        _write_module_file(ext / "multi.py", "FirstModule", "First")
+        with (ext / "multi.py").open("a") as f:
+            f.write('\nclass SecondModule(FirstModule):\n    description = "Second"\n')
+        id_map = tmp_path / "id_map.yaml"
+        id_map.write_text(yaml.dump({"mappings": [{"file": "multi.py", "id": "picked", "class": "SecondModule"}]}))
+        reg = Registry(extensions_dir=str(ext), id_map_path=str(id_map))
+        assert reg.discover() == 1
+        assert type(reg.get("picked")).__name__ == "SecondModule"
 
     def test_discover_on_load_called(self, tmp_path: Path) -> None:
         """discover() calls on_load() for each module."""
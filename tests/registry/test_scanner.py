@@ -240,3 +240,20 @@ class TestScanMultiRoot:
         result = scan_multi_root([{"root": str(ext_dir), "namespace": "custom"}])
         assert result[0].canonical_id == "custom.mod"
         assert result[0].namespace == "custom"
+
+    def test_duplicate_id_across_roots_skipped(self, tmp_path: Path) -> None:
+        """A canonical ID produced by two roots is kept only for the first root."""
+        root_a = tmp_path / "root_a"
+        root_b = tmp_path / "root_b"
+        (root_a / "b").mkdir(parents=True)
+        root_b.mkdir()
+        (root_a / "b" / "c.py").write_text("")
+        (root_b / "c.py").write_text("")
+        result = scan_multi_root(
+            [
+                {"root": str(root_a), "namespace": "a"},
+                {"root": str(root_b), "namespace": "a.b"},
+            ]
+        )
+        assert [(m.canonical_id, m.namespace) for m in result] == [("a.b.c", "a")]
+        assert result[0].file_path == root_a / "b" / "c.py"
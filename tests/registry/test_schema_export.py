@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -13,12 +15,13 @@ from apcore.errors import ModuleNotFoundError
 from apcore.module import ModuleAnnotations, ModuleExample
 from apcore.registry.registry import Registry
 from apcore.registry.schema_export import (
+    _apply_compact,
     export_all_schemas,
     export_schema,
     get_all_schemas,
     get_schema,
 )
-
+from apcore.schema.types import ExportProfile
 
 # ---------------------------------------------------------------------------
 # Helper schemas and modules
@@ -138,6 +141,25 @@ class TestGetSchema:
         assert examples[0]["title"] == "Basic search"
         assert examples[0]["inputs"]["query"] == "hello"
 
+    def test_dataclass_fields_match_asdict(self) -> None:
+        """Annotations and examples carry the same keys and values as dataclasses.asdict."""
+        reg = _make_registry()
+        result = get_schema(reg, "test.annotated")
+        assert result is not None
+        assert result["annotations"] == dataclasses.asdict(_AnnotatedModule.annotations)
+        assert result["examples"] == [dataclasses.asdict(ex) for ex in _AnnotatedModule.examples]
+
+    def test_modifying_exported_examples_leaves_module_unchanged(self) -> None:
+        """Exported example inputs/output are copies, as with dataclasses.asdict."""
+        reg = _make_registry()
+        result = get_schema(reg, "test.annotated")
+        assert result is not None
+        result["examples"][0]["inputs"]["query"] = "changed"
+        result["examples"][0]["output"]["results"].append("extra")
+        example = _AnnotatedModule.examples[0]
+        assert example.inputs == {"query": "hello", "limit": 5}
+        assert example.output == {"results": ["hello world"], "count": 1}
+
     def test_no_annotations_returns_none(self) -> None:
         """Module without annotations has None in annotations field."""
         reg = _make_registry()
@@ -152,6 +174,30 @@ class TestGetSchema:
         assert result is not None
         assert result["examples"] == []
 
+    def test_json_schemas_built_once_per_schema_class(self) -> None:
+        """Schemas are built once per model class, across calls, re-registration and registries."""
+
+        class FreshInput(BaseModel):
+            query: str
+
+        class FreshModule(_SimpleModule):
+            input_schema = FreshInput
+
+        reg = Registry()
+        reg.register("test.fresh", FreshModule())
+        with patch.object(FreshInput, "model_json_schema", wraps=FreshInput.model_json_schema) as spy:
+            get_schema(reg, "test.fresh")
+            get_schema(reg, "test.fresh")
+            reg.unregister("test.fresh")
+            reg.register("test.fresh", FreshModule())
+            other = Registry()
+            other.register("test.other", FreshModule())
+            get_schema(reg, "test.fresh")
+            result = get_schema(other, "test.other")
+            assert spy.call_count == 1
+        assert result is not None
+        assert "query" in result["input_schema"]["properties"]
+
 
 # ---------------------------------------------------------------------------
 # export_schema() tests
@@ -173,6 +219,13 @@ class TestExportSchema:
         parsed = yaml.safe_load(result)
         assert parsed["module_id"] == "test.annotated"
 
+    def test_export_yaml_matches_default_dumper(self) -> None:
+        """YAML output is identical to yaml.dump with the default Dumper."""
+        reg = _make_registry()
+        result = export_schema(reg, "test.annotated", format="yaml")
+        expected = yaml.dump(get_schema(reg, "test.annotated"), default_flow_style=False)
+        assert result == expected
+
     def test_strict_mode(self) -> None:
         """export_schema strict=True applies strict transformations."""
         reg = _make_registry()
@@ -194,6 +247,31 @@ class TestExportSchema:
         assert "examples" not in parsed
         assert "documentation" not in parsed
 
+    def test_compact_leaves_source_schema_unchanged(self) -> None:
+        """Compact transforms work on copies of the schemas they strip."""
+        schema = {
+            "description": "One. Two.",
+            "input_schema": {"type": "object", "x-internal": True},
+            "output_schema": {"type": "object"},
+            "examples": [],
+        }
+        result = _apply_compact(schema)
+        assert result["input_schema"] == {"type": "object"}
+        assert result["description"] == "One."
+        assert "examples" not in result
+        assert schema["input_schema"] == {"type": "object", "x-internal": True}
+        assert schema["description"] == "One. Two."
+        assert "examples" in schema
+
+    def test_compact_truncates_at_first_newline(self) -> None:
+        """A newline before the first ". " ends the compact description."""
+        reg = Registry()
+        mod = _AnnotatedModule()
+        mod.description = "Summary line\nMore text. And more."
+        reg.register("test.mod", mod)
+        parsed = json.loads(export_schema(reg, "test.mod", compact=True))
+        assert parsed["description"] == "Summary line"
+
     def test_nonexistent_raises(self) -> None:
         """export_schema raises ModuleNotFoundError for missing module."""
         reg = _make_registry()
@@ -209,6 +287,18 @@ class TestExportSchema:
         assert "name" in parsed
         assert "inputSchema" in parsed
 
+    def test_profile_accepts_enum_member(self) -> None:
+        """An ExportProfile member selects the same profile as its string value."""
+        reg = _make_registry()
+        by_member = export_schema(reg, "test.annotated", profile=ExportProfile.OPENAI)
+        assert by_member == export_schema(reg, "test.annotated", profile="openai")
+
+    def test_invalid_profile_raises(self) -> None:
+        """An unknown profile name raises ValueError."""
+        reg = _make_registry()
+        with pytest.raises(ValueError, match="not a valid ExportProfile"):
+            export_schema(reg, "test.annotated", profile="unknown")
+
 
 # ---------------------------------------------------------------------------
 # get_all_schemas() / export_all_schemas() tests
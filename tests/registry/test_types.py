@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 from apcore.module import ModuleAnnotations, ModuleExample
@@ -158,6 +159,13 @@ class TestDiscoveredModule:
         assert dm.meta_path == Path("/some/path_meta.yaml")
         assert dm.namespace == "mynamespace"
 
+    def test_slotted_instances_stay_mutable_and_picklable(self) -> None:
+        """Slotted instances have no __dict__ but fields can still be reassigned and pickled."""
+        dm = DiscoveredModule(file_path=Path("/some/path.py"), canonical_id="some.path")
+        assert not hasattr(dm, "__dict__")
+        dm.canonical_id = "renamed"
+        assert pickle.loads(pickle.dumps(dm)) == dm
+
 
 # === DependencyInfo tests ===
 
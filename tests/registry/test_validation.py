@@ -150,3 +150,17 @@ class TestValidateModule:
         assert "description" in error_text
         assert "input_schema" not in error_text
         assert "execute" not in error_text
+
+    def test_repeated_validation_returns_independent_lists(self) -> None:
+        """Cached results are returned as fresh lists callers may modify."""
+
+        class NoDescription:
+            input_schema = SimpleInput
+            output_schema = SimpleOutput
+
+            def execute(self, inputs: dict, context: Any) -> dict:
+                return {}
+
+        first = validate_module(NoDescription)
+        first.append("extra")
+        assert validate_module(NoDescription()) == ["Missing or empty description"]
@@ -28,6 +28,11 @@ class TestMergeAnnotations:
         assert result.destructive is True
         assert result.idempotent is False
 
+    def test_code_only_returns_same_instance(self) -> None:
+        code = ModuleAnnotations(readonly=True)
+        assert merge_annotations(None, code) is code
+        assert merge_annotations({"unknown": 1}, code) is code
+
     def test_only_yaml(self) -> None:
         result = merge_annotations({"readonly": True}, None)
         assert result.readonly is True
@@ -105,6 +110,11 @@ class TestMergeExamples:
         assert result[0].output == {"b": 2}
         assert result[0].description == "desc"
 
+    def test_yaml_unknown_example_keys_ignored(self) -> None:
+        yaml = [{"title": "Ex", "inputs": {"a": 1}, "notes": "extra"}]
+        result = merge_examples(yaml, None)
+        assert result == [ModuleExample(title="Ex", inputs={"a": 1})]
+
 
 # === merge_metadata() ===
 
@@ -161,6 +161,12 @@ class TestExportOpenai:
         assert result["type"] == "function"
         assert "function" in result
 
+    def test_source_schema_not_mutated(self) -> None:
+        sd = _make_schema_def()
+        original = _make_schema_def().input_schema
+        SchemaExporter().export_openai(sd)
+        assert sd.input_schema == original
+
 
 # ===== export_anthropic() =====
 
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationError, field_validator
 
 from apcore.config import Config
 from apcore.errors import SchemaNotFoundError, SchemaParseError
@@ -85,6 +87,13 @@ class TestLoad:
         with pytest.raises(SchemaNotFoundError):
             loader.load("nonexistent.module")
 
+    def test_schema_created_after_missing_load_is_found(self, tmp_path: Path) -> None:
+        loader = make_loader(tmp_path)
+        with pytest.raises(SchemaNotFoundError):
+            loader.load("simple")
+        write_simple_schema(tmp_path)
+        assert loader.load("simple").module_id == "simple"
+
     def test_invalid_yaml_raises(self, tmp_path: Path) -> None:
         bad = tmp_path / "bad.schema.yaml"
         bad.write_text("{{invalid: yaml: ---")
@@ -485,6 +494,40 @@ class TestGenerateModel:
         with pytest.raises(Exception):
             Model(qty=7)
 
+    def test_unique_items_does_not_leak_to_other_arrays(self, tmp_path: Path) -> None:
+        loader = self._make_loader(tmp_path)
+        Model = loader.generate_model(
+            {
+                "type": "object",
+                "properties": {
+                    "ids": {"type": "array", "items": {"type": "integer"}, "maxItems": 5, "uniqueItems": True},
+                    "scores": {"type": "array", "items": {"type": "integer"}, "maxItems": 5},
+                },
+                "required": ["ids", "scores"],
+            },
+            "TestUniqueLeak",
+        )
+        assert Model(ids=[1, 2], scores=[3, 3]).scores == [3, 3]
+        with pytest.raises(ValidationError):
+            Model(ids=[1, 1], scores=[3])
+
+    def test_array_length_uses_item_keywords(self, tmp_path: Path) -> None:
+        loader = self._make_loader(tmp_path)
+        Model = loader.generate_model(
+            {
+                "type": "object",
+                "properties": {
+                    "tags": {"type": "array", "items": {"type": "string"}, "minItems": 2, "minLength": 5},
+                    "code": {"type": "string", "minItems": 5},
+                },
+                "required": ["tags", "code"],
+            },
+            "TestArrayLength",
+        )
+        assert Model(tags=["a", "b"], code="x").tags == ["a", "b"]
+        with pytest.raises(ValidationError):
+            Model(tags=["a"], code="x")
+
     def test_one_of(self, tmp_path: Path) -> None:
         loader = self._make_loader(tmp_path)
         Model = loader.generate_model(
@@ -629,6 +672,25 @@ class TestGenerateModel:
         obj = Model(email="not-an-email")
         assert obj.email == "not-an-email"
 
+    def test_identical_nested_schemas_keep_their_own_names(self, tmp_path: Path) -> None:
+        loader = self._make_loader(tmp_path)
+        address = {"type": "object", "properties": {"street": {"type": "string"}}, "required": ["street"]}
+        ModelA = loader.generate_model(
+            {"type": "object", "properties": {"home": dict(address)}, "required": ["home"]}, "TestA"
+        )
+        ModelB = loader.generate_model(
+            {"type": "object", "properties": {"billing": dict(address)}, "required": ["billing"]}, "TestB"
+        )
+        assert ModelB.model_fields["billing"].annotation.__name__ == "TestB_billing"
+        assert list(ModelB.model_json_schema()["$defs"]) == ["TestB_billing"]
+        assert ModelA.model_fields["home"].annotation.__name__ == "TestA_home"
+
+    def test_regenerating_same_schema_returns_same_class(self, tmp_path: Path) -> None:
+        loader = self._make_loader(tmp_path)
+        schema = {"type": "object", "properties": {"n": {"type": "integer"}}}
+        assert loader.generate_model(schema, "TestMemo") is loader.generate_model(dict(schema), "TestMemo")
+        assert loader.generate_model(schema, "TestMemoOther").__name__ == "TestMemoOther"
+
 
 # === get_schema() ===
 
@@ -678,6 +740,26 @@ class TestGetSchema:
         input_rs, _ = loader.get_schema("simple", native_input_schema=InputModel, native_output_schema=OutputModel)
         assert input_rs.model is InputModel
 
+    def test_native_json_schema_computed_once_per_model(self, tmp_path: Path) -> None:
+        class InputModel(BaseModel):
+            x: int
+
+        class OutputModel(BaseModel):
+            y: str
+
+        config = Config({"schema": {"root": str(tmp_path), "strategy": "native_first"}})
+        loader = SchemaLoader(config, schemas_dir=tmp_path)
+        with patch.object(InputModel, "model_json_schema", wraps=InputModel.model_json_schema) as spy:
+            first, _ = loader.get_schema("a", native_input_schema=InputModel, native_output_schema=OutputModel)
+            loader.clear_cache()
+            second, _ = loader.get_schema("b", native_input_schema=InputModel, native_output_schema=OutputModel)
+            assert spy.call_count == 1
+        assert second.json_schema == first.json_schema
+        assert second.module_id == "b"
+        # Each caller gets its own copy of the cached schema
+        first.json_schema["properties"]["x"]["type"] = "string"
+        assert second.json_schema["properties"]["x"]["type"] == "integer"
+
     def test_native_first_fallback_to_yaml(self, tmp_path: Path) -> None:
         write_simple_schema(tmp_path)
         config = Config({"schema": {"root": str(tmp_path), "strategy": "native_first"}})
@@ -746,3 +828,88 @@ class TestClearCache:
         sd2 = loader.load("simple")
         assert sd2.description == "Updated"
         assert sd1 is not sd2
+
+
+# === schema.cache_dir ===
+
+
+def make_disk_cached_loader(schemas_dir: Path, cache_dir: Path) -> SchemaLoader:
+    config = Config({"schema": {"root": str(schemas_dir), "cache_dir": str(cache_dir)}})
+    return SchemaLoader(config, schemas_dir=schemas_dir)
+
+
+class TestDiskCache:
+    def test_second_loader_reuses_resolved_schemas(self, tmp_path: Path) -> None:
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        write_simple_schema(schemas_dir)
+        first_in, _ = make_disk_cached_loader(schemas_dir, cache_dir).get_schema("simple")
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        loader = make_disk_cached_loader(schemas_dir, cache_dir)
+        second_in, _ = loader.get_schema("simple")
+        assert loader._schema_cache == {}  # served without parsing the YAML
+        assert second_in.json_schema == first_in.json_schema
+        assert second_in.model(table="users").table == "users"  # type: ignore[attr-defined]
+
+    def test_changed_ref_target_invalidates_entry(self, tmp_path: Path) -> None:
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        write_yaml(schemas_dir / "common.schema.yaml", {"Name": {"type": "string"}})
+        write_yaml(
+            schemas_dir / "user.schema.yaml",
+            {
+                "description": "User",
+                "input_schema": {"type": "object", "properties": {"name": {"$ref": "common.schema.yaml#/Name"}}},
+                "output_schema": {"type": "object"},
+            },
+        )
+        make_disk_cached_loader(schemas_dir, cache_dir).get_schema("user")
+        write_yaml(schemas_dir / "common.schema.yaml", {"Name": {"type": "integer"}})
+        input_rs, _ = make_disk_cached_loader(schemas_dir, cache_dir).get_schema("user")
+        assert input_rs.json_schema["properties"]["name"] == {"type": "integer"}
+
+    def test_corrupt_entry_is_ignored(self, tmp_path: Path) -> None:
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        write_simple_schema(schemas_dir)
+        make_disk_cached_loader(schemas_dir, cache_dir).get_schema("simple")
+        for entry in cache_dir.glob("*.json"):
+            entry.write_bytes(b"{not json")
+        input_rs, _ = make_disk_cached_loader(schemas_dir, cache_dir).get_schema("simple")
+        assert "table" in input_rs.json_schema["properties"]
+
+    def test_wrongly_shaped_entry_is_ignored(self, tmp_path: Path) -> None:
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        write_simple_schema(schemas_dir)
+        make_disk_cached_loader(schemas_dir, cache_dir).get_schema("simple")
+        good = {"module_id": "simple", "input_schema": {}, "output_schema": {}, "ref_digests": {}}
+        bads: list[Any] = [
+            ["simple", {}, {}, {}],
+            {k: v for k, v in good.items() if k != "ref_digests"},
+            {**good, "ref_digests": ["not", "a", "dict"]},
+            {**good, "ref_digests": {"common.schema.yaml": 1}},
+            {**good, "input_schema": []},
+        ]
+        for bad in bads:
+            for entry in cache_dir.glob("*.json"):
+                entry.write_text(json.dumps(bad))
+            input_rs, _ = make_disk_cached_loader(schemas_dir, cache_dir).get_schema("simple")
+            assert "table" in input_rs.json_schema["properties"]
+
+    def test_schema_that_does_not_round_trip_through_json_is_not_cached(self, tmp_path: Path) -> None:
+        schemas_dir = tmp_path / "schemas"
+        cache_dir = tmp_path / "cache"
+        schemas_dir.mkdir()
+        (schemas_dir / "dated.schema.yaml").write_text(
+            "description: Dated\n"
+            "input_schema:\n"
+            "  type: object\n"
+            "  properties:\n"
+            "    day: {type: string, examples: [2024-01-01]}\n"
+            "output_schema: {type: object}\n"
+        )
+        input_rs, _ = make_disk_cached_loader(schemas_dir, cache_dir).get_schema("dated")
+        assert "day" in input_rs.json_schema["properties"]
+        assert list(cache_dir.glob("*.json")) == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +47,31 @@ class TestLocalRef:
             "properties": {"street": {"type": "string"}},
         }
 
+    def test_resolve_refs_inside_lists(self, tmp_path: Path) -> None:
+        schema = {
+            "definitions": {"Id": {"type": "integer"}, "Name": {"type": "string"}},
+            "properties": {
+                "key": {"oneOf": [{"$ref": "#/definitions/Id"}, {"items": [{"$ref": "#/definitions/Name"}]}]},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        result = resolver.resolve(schema)
+        assert result["properties"]["key"]["oneOf"] == [{"type": "integer"}, {"items": [{"type": "string"}]}]
+
+    def test_root_ref_replaced_by_target(self, tmp_path: Path) -> None:
+        schema = {
+            "$ref": "#/definitions/Root",
+            "definitions": {
+                "Root": {"type": "object", "properties": {"id": {"$ref": "#/definitions/Id"}}},
+                "Id": {"type": "integer"},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        result = resolver.resolve(schema)
+        assert result["type"] == "object"
+        assert result["properties"]["id"] == {"type": "integer"}
+        assert "$ref" not in result
+
     def test_resolve_local_ref_nested_pointer(self, tmp_path: Path) -> None:
         schema = {
             "type": "object",
@@ -230,6 +256,24 @@ class TestCircularRef:
         with pytest.raises(SchemaCircularRefError):
             resolver.resolve(schema, current_file=file_a)
 
+    def test_shared_ref_in_sibling_branches_is_not_circular(self, tmp_path: Path) -> None:
+        schema = {
+            "definitions": {
+                "Name": {"type": "string"},
+                "Pair": {"type": "object", "properties": {"a": {"$ref": "#/definitions/Name"}}},
+            },
+            "properties": {
+                "first": {"$ref": "#/definitions/Pair"},
+                "second": {"$ref": "#/definitions/Pair"},
+                "name": {"$ref": "#/definitions/Name"},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        result = resolver.resolve(schema)
+        assert result["properties"]["first"] == result["properties"]["second"]
+        assert result["properties"]["second"]["properties"]["a"] == {"type": "string"}
+        assert result["properties"]["name"] == {"type": "string"}
+
 
 # === $ref sibling handling ===
 
@@ -277,6 +321,92 @@ class TestFileCache:
         shared_path = (tmp_path / "shared.schema.yaml").resolve()
         assert shared_path in resolver._file_cache
 
+    def test_modified_file_reparsed(self, tmp_path: Path) -> None:
+        shared = write_yaml(tmp_path / "shared.schema.yaml", {"Foo": {"type": "string"}})
+        schema = {"properties": {"a": {"$ref": "shared.schema.yaml#/Foo"}}}
+        resolver = RefResolver(tmp_path)
+        assert resolver.resolve(schema)["properties"]["a"] == {"type": "string"}
+        write_yaml(shared, {"Foo": {"type": "integer"}})
+        st = shared.stat()
+        os.utime(shared, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert resolver.resolve(schema)["properties"]["a"] == {"type": "integer"}
+
+    def test_loaded_file_digests_cover_last_resolve(self, tmp_path: Path) -> None:
+        shared = write_yaml(tmp_path / "shared.schema.yaml", {"Foo": {"type": "string"}})
+        schema = {"properties": {"a": {"$ref": "shared.schema.yaml#/Foo"}}}
+        resolver = RefResolver(tmp_path)
+        resolver.resolve(schema)
+        first = resolver.loaded_file_digests()
+        assert list(first) == [shared.resolve()]
+        resolver.resolve(schema)  # served from the cache, still reported
+        assert resolver.loaded_file_digests() == first
+        resolver.resolve({"type": "object"})
+        assert resolver.loaded_file_digests() == {}
+
+    def test_transitive_files_prefetched(self, tmp_path: Path) -> None:
+        write_yaml(tmp_path / "leaf.schema.yaml", {"Id": {"type": "integer"}})
+        write_yaml(tmp_path / "a.schema.yaml", {"A": {"$ref": "./leaf.schema.yaml#/Id"}})
+        write_yaml(tmp_path / "b.schema.yaml", {"B": {"$ref": "./leaf.schema.yaml#/Id"}})
+        schema = {
+            "properties": {
+                "a": {"$ref": "a.schema.yaml#/A"},
+                "b": {"$ref": "b.schema.yaml#/B"},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        resolver._prefetch_refs(schema, None)
+        assert {p.name for p in resolver._file_cache} == {"a.schema.yaml", "b.schema.yaml", "leaf.schema.yaml"}
+        result = resolver.resolve(schema)
+        assert result["properties"] == {"a": {"type": "integer"}, "b": {"type": "integer"}}
+
+    def test_prefetch_pool_is_built_once_and_reused(self, tmp_path: Path) -> None:
+        write_yaml(tmp_path / "a.schema.yaml", {"A": {"type": "string"}})
+        write_yaml(tmp_path / "b.schema.yaml", {"B": {"type": "integer"}})
+        schema = {"properties": {"a": {"$ref": "a.schema.yaml#/A"}, "b": {"$ref": "b.schema.yaml#/B"}}}
+        resolver = RefResolver(tmp_path)
+        resolver.resolve({"properties": {"a": {"$ref": "a.schema.yaml#/A"}}})
+        assert resolver._prefetch_pool is None  # a single file is loaded inline
+        resolver.resolve(schema)
+        pool = resolver._prefetch_pool
+        assert pool is not None
+        resolver.resolve(schema)
+        assert resolver._prefetch_pool is pool
+
+    def test_prefetch_picks_up_changed_files(self, tmp_path: Path) -> None:
+        a = write_yaml(tmp_path / "a.schema.yaml", {"A": {"type": "string"}})
+        write_yaml(tmp_path / "b.schema.yaml", {"B": {"type": "integer"}})
+        schema = {"properties": {"a": {"$ref": "a.schema.yaml#/A"}, "b": {"$ref": "b.schema.yaml#/B"}}}
+        resolver = RefResolver(tmp_path)
+        resolver.resolve(schema)
+        first_digests = resolver.loaded_file_digests()
+        write_yaml(a, {"A": {"type": "boolean"}})
+        st = a.stat()
+        os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        resolver._checked_files.clear()
+        resolver._prefetch_refs(schema, None)
+        assert resolver._file_cache[a.resolve()] == {"A": {"type": "boolean"}}
+        assert resolver._file_digests[a.resolve()] != first_digests[a.resolve()]
+
+    def test_prefetch_defers_errors_to_resolution(self, tmp_path: Path) -> None:
+        write_yaml(tmp_path / "ok.schema.yaml", {"Ok": {"type": "string"}})
+        schema = {
+            "properties": {
+                "ok": {"$ref": "ok.schema.yaml#/Ok"},
+                "missing": {"$ref": "missing.schema.yaml#/Nope"},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        with pytest.raises(SchemaNotFoundError):
+            resolver.resolve(schema)
+
+    def test_parsed_refs_memoized_until_clear(self, tmp_path: Path) -> None:
+        resolver = RefResolver(tmp_path)
+        first = resolver._parse_ref("./shared.schema.yaml#/Foo", None)
+        assert resolver._parse_ref("./shared.schema.yaml#/Foo", None) is first
+        assert first == ((tmp_path / "shared.schema.yaml").resolve(), "/Foo")
+        resolver.clear_cache()
+        assert resolver._parsed_refs == {}
+
 
 # === JSON Pointer RFC 6901 ===
 
@@ -352,3 +482,27 @@ class TestEdgeCases:
         resolver = RefResolver(tmp_path)
         resolver.resolve(original)
         assert original == snapshot
+
+    def test_resolved_refs_do_not_share_containers(self, tmp_path: Path) -> None:
+        schema = {
+            "definitions": {"Tags": {"type": "array", "items": {"type": "string"}}},
+            "properties": {
+                "a": {"$ref": "#/definitions/Tags"},
+                "b": {"$ref": "#/definitions/Tags"},
+            },
+        }
+        resolver = RefResolver(tmp_path)
+        result = resolver.resolve(schema)
+        result["properties"]["a"]["items"]["type"] = "integer"
+        assert result["properties"]["b"]["items"] == {"type": "string"}
+        assert result["definitions"]["Tags"]["items"] == {"type": "string"}
+        assert schema["definitions"]["Tags"]["items"] == {"type": "string"}
+
+    def test_schema_without_refs_returned_as_copy(self, tmp_path: Path) -> None:
+        schema = {"type": "object", "properties": {"tags": {"type": "array", "items": [{"type": "string"}]}}}
+        resolver = RefResolver(tmp_path)
+        result = resolver.resolve(schema)
+        assert result == schema
+        assert result is not schema
+        assert result["properties"]["tags"]["items"] is not schema["properties"]["tags"]["items"]
+        assert resolver._file_cache == {}
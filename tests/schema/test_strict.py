@@ -7,6 +7,7 @@ from typing import Any
 
 from apcore.schema.strict import (
     _apply_llm_descriptions,
+    _copy_without_extensions,
     _strip_extensions,
     to_strict_schema,
 )
@@ -165,6 +166,19 @@ class TestToStrictSchema:
         result = to_strict_schema(schema)
         assert result["required"] == ["apple", "mango", "zebra"]
 
+    def test_only_schema_keywords_made_strict(self) -> None:
+        schema: dict[str, Any] = {
+            "type": "object",
+            "properties": {"x-note": {"type": "string"}, "ref": {"$ref": "#/$defs/Item"}},
+            "$defs": {"Item": {"type": "object", "properties": {"id": {"type": "integer", "default": 0}}}},
+            "not": {"type": "object", "properties": {"y": {"type": "string", "x-z": 1}}},
+        }
+        result = to_strict_schema(schema)
+        assert result["required"] == ["ref"]
+        assert result["properties"]["ref"] == {"oneOf": [{"$ref": "#/$defs/Item"}, {"type": "null"}]}
+        assert result["$defs"]["Item"]["properties"]["id"] == {"type": ["integer", "null"]}
+        assert result["not"] == {"type": "object", "properties": {"y": {"type": "string"}}}
+
 
 # === _apply_llm_descriptions() ===
 
@@ -229,3 +243,26 @@ class TestStripExtensions:
         assert "type" in node
         assert "description" in node
         assert "properties" in node
+
+    def test_list_items_and_deep_nesting(self) -> None:
+        leaf: dict[str, Any] = {"x-leaf": True, "type": "string"}
+        node: dict[str, Any] = {"anyOf": [leaf, "not-a-dict"]}
+        for _ in range(2000):
+            node = {"items": node, "default": None}
+        _strip_extensions(node)
+        assert leaf == {"type": "string"}
+        assert "default" not in node
+
+    def test_copy_without_extensions_matches_strip(self) -> None:
+        node: dict[str, Any] = {
+            "type": "object",
+            "x-top": 1,
+            "properties": {"a": {"type": "string", "default": "d", "x-llm-description": "A"}},
+            "anyOf": [{"x-k": 1, "type": "null"}, [{"x-inner": 1}]],
+        }
+        original = copy.deepcopy(node)
+        expected = copy.deepcopy(node)
+        _strip_extensions(expected)
+        result = _copy_without_extensions(node)
+        assert result == expected
+        assert node == original
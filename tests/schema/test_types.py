@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 from pydantic import BaseModel
 
@@ -115,6 +117,15 @@ class TestResolvedSchema:
         assert rs.module_id == "test.mod"
         assert rs.direction == "input"
 
+    def test_frozen_and_slotted(self) -> None:
+        class DummyModel(BaseModel):
+            pass
+
+        rs = ResolvedSchema(json_schema={}, model=DummyModel, module_id="test.mod", direction="input")
+        assert not hasattr(rs, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rs.direction = "output"  # type: ignore[misc]
+
 
 class TestSchemaValidationErrorDetail:
     def test_all_fields(self) -> None:
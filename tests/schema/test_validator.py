@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import Literal
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 from apcore.errors import SchemaValidationError
 from apcore.schema.validator import SchemaValidator
@@ -140,6 +142,21 @@ class TestValidate:
         assert result.valid is True
 
 
+# === is_valid() ===
+
+
+class TestIsValid:
+    def test_agrees_with_validate(self, validator: SchemaValidator) -> None:
+        assert validator.is_valid({"name": "Alice", "age": 30}, SimpleModel) is True
+        assert validator.is_valid({"name": "Alice"}, SimpleModel) is False
+        assert validator.is_valid({"name": "A", "count": 5, "code": "ABC"}, ConstrainedModel) is False
+
+    def test_respects_coercion_setting(self, validator: SchemaValidator, strict_validator: SchemaValidator) -> None:
+        data = {"name": "Alice", "age": "30"}
+        assert validator.is_valid(data, SimpleModel) is True
+        assert strict_validator.is_valid(data, SimpleModel) is False
+
+
 # === validate_input() ===
 
 
@@ -166,6 +183,21 @@ class TestValidateInput:
         with pytest.raises(SchemaValidationError):
             strict_validator.validate_input({"name": "Alice", "age": "30"}, SimpleModel)
 
+    def test_matches_model_dump(self, validator: SchemaValidator) -> None:
+        data = {"address": {"city": "Paris", "zip_code": "75001"}}
+        first = validator.validate_input(data, NestedModel)
+        assert first == NestedModel.model_validate(data).model_dump()
+        assert validator.validate_input(data, NestedModel) == first
+
+    def test_validated_model_can_be_collected(self, validator: SchemaValidator) -> None:
+        model = create_model("Transient", name=(str, ...))
+        validator.validate_input({"name": "x"}, model)
+        assert validator.is_valid({"name": "x"}, model)
+        ref = weakref.ref(model)
+        del model
+        gc.collect()
+        assert ref() is None
+
 
 # === validate_output() ===
 
@@ -480,6 +480,19 @@ class TestACLRuntimeModification:
         assert result is True
         assert len(acl._rules) == 0
 
+    # Test: a removed rule no longer takes part in check()
+    def test_remove_rule_stops_matching(self) -> None:
+        """check() falls through to the remaining rules after remove_rule()."""
+        acl = ACL(
+            rules=[
+                ACLRule(callers=["api.*"], targets=["db.*"], effect="allow"),
+                ACLRule(callers=["*"], targets=["*"], effect="deny"),
+            ]
+        )
+        assert acl.check(caller_id="api.handler", target_id="db.read") is True
+        acl.remove_rule(callers=["api.*"], targets=["db.*"])
+        assert acl.check(caller_id="api.handler", target_id="db.read") is False
+
     # Test: remove_rule returns False when no match
     def test_remove_rule_returns_false_when_no_match(self) -> None:
         """remove_rule() returns False when no rule has matching callers+targets."""
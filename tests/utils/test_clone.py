@@ -0,0 +1,22 @@
+"""Tests for copying JSON-like data."""
+
+from __future__ import annotations
+
+from apcore.utils import clone_json
+
+
+class TestCloneJson:
+    def test_copy_is_equal(self) -> None:
+        tree = {"a": [1, {"b": "c"}], "d": None, "e": 1.5}
+        assert clone_json(tree) == tree
+
+    def test_nested_containers_are_not_shared(self) -> None:
+        tree = {"a": [1, {"b": "c"}]}
+        copy = clone_json(tree)
+        copy["a"][1]["b"] = "changed"
+        copy["a"].append(2)
+        assert tree == {"a": [1, {"b": "c"}]}
+
+    def test_scalars_are_returned_as_is(self) -> None:
+        assert clone_json("x") == "x"
+        assert clone_json(None) is None
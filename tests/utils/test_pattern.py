@@ -0,0 +1,50 @@
+"""Tests for wildcard module ID pattern matching."""
+
+from __future__ import annotations
+
+import pytest
+
+from apcore.utils.pattern import compile_pattern, match_pattern
+
+
+class TestMatchPattern:
+    """Each pattern shape gives the same answer as segment-by-segment matching."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "module_id", "expected"),
+        [
+            ("*", "", True),
+            ("*", "any.module", True),
+            ("email.send", "email.send", True),
+            ("email.send", "email.sender", False),
+            ("email.*", "email.send", True),
+            ("email.*", "sms.send", False),
+            ("*.send", "email.send", True),
+            ("*.send", "email.sender", False),
+            ("a*a", "a", False),
+            ("a*a", "aa", True),
+            ("*mail*", "email.send", True),
+            ("*mail*", "sms.send", False),
+            ("**", "x", True),
+            ("a*b*c", "axbyc", True),
+            ("a*b*c", "acb", False),
+            ("*b*b", "ab", False),
+            ("*b*b", "abxb", True),
+            ("a.(b)*", "a.(b)+c", True),
+            ("*.internal.*.admin", "billing.internal.users.admin", True),
+            ("*.internal.*.admin", "billing.invoices.admin", False),
+        ],
+    )
+    def test_match(self, pattern: str, module_id: str, expected: bool) -> None:
+        """Literal, prefix/suffix, infix and multi-wildcard patterns all match as expected."""
+        assert match_pattern(pattern, module_id) is expected
+
+    def test_compiled_predicate_matches_like_match_pattern(self) -> None:
+        """compile_pattern() returns a predicate with match_pattern's answers."""
+        predicate = compile_pattern("*.internal.*")
+        for module_id in ("a.internal.b", "a.b", ".internal."):
+            assert predicate(module_id) is match_pattern("*.internal.*", module_id)
+
+    def test_literal_pattern_rejects_non_str(self) -> None:
+        """A literal pattern's predicate returns False, not NotImplemented, for non-str IDs."""
+        assert compile_pattern("email.send")(None) is False  # type: ignore[arg-type]